@@ -0,0 +1,55 @@
+"""
+Redis-backed cache helpers shared across domains.
+
+Cache failures are logged and treated as misses so that an unavailable Redis
+never breaks a request.
+"""
+import json
+import logging
+from functools import lru_cache
+from typing import Any
+
+from redis.asyncio import Redis
+
+from base.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache
+def get_redis() -> Redis:
+    """Get the cached Redis client instance."""
+    return Redis.from_url(get_settings().redis_url, decode_responses=True)
+
+
+async def cache_get_json(key: str) -> Any | None:
+    """Get a JSON value from the cache, or None on a miss."""
+    try:
+        raw = await get_redis().get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for '{key}': {str(e)}")
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+async def cache_set_json(key: str, value: Any, ttl: int | None = None) -> None:
+    """Store a JSON-serializable value in the cache with an optional TTL in seconds."""
+    try:
+        await get_redis().set(key, json.dumps(value), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Cache write failed for '{key}': {str(e)}")
+
+
+async def cache_delete(key: str) -> bool:
+    """Delete a cache entry. Returns True if the key existed."""
+    try:
+        return bool(await get_redis().delete(key))
+    except Exception as e:
+        logger.warning(f"Cache delete failed for '{key}': {str(e)}")
+        return False
+
+
+async def close_cache() -> None:
+    """Close the Redis connection pool and drop the cached client."""
+    await get_redis().aclose()
+    get_redis.cache_clear()
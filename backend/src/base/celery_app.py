@@ -0,0 +1,43 @@
+"""
+Celery application used to run long-running jobs (video rendering) in worker processes.
+"""
+from celery import Celery
+from celery.signals import worker_init
+
+from base.config import get_settings
+
+settings = get_settings()
+
+celery_app = Celery(
+    "aive",
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
+    include=["render.tasks", "video_processing.tasks"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    # Render jobs go to a dedicated queue consumed by ffmpeg-capable workers
+    task_routes={"render.run_render": {"queue": settings.render_queue}},
+    # Renders are long; only acknowledge once finished and fetch one job at a time
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    # Each render runs a multi-threaded encoder; cap parallel renders so they
+    # don't oversubscribe the CPU
+    worker_concurrency=settings.render_concurrency,
+    # Periodic housekeeping, run by `celery beat`
+    beat_schedule={
+        "cleanup-temp-files": {
+            "task": "video_processing.cleanup_temp_files",
+            "schedule": settings.temp_cleanup_interval,
+        },
+    },
+)
+
+
+@worker_init.connect
+def ensure_directories(**kwargs) -> None:
+    """Create the static directories once when a worker starts."""
+    settings.ensure_directories()
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 from pathlib import Path
 
@@ -25,6 +26,12 @@ class Settings(BaseSettings):
     postgres_db: str = Field(default="aive_db", alias="POSTGRES_DB")
     database_host: str = Field(default="localhost", alias="DATABASE_HOST")
     database_port: int = Field(default=5432, alias="DATABASE_PORT")
+    # Connection pool per process; API workers and render workers each hold one
+    database_pool_size: int = Field(default=10, alias="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=20, alias="DATABASE_MAX_OVERFLOW")
+    database_pool_recycle: int = Field(
+        default=1800, alias="DATABASE_POOL_RECYCLE"
+    )  # 30min
     
     @property
     def database_url(self) -> str:
@@ -45,6 +52,12 @@ class Settings(BaseSettings):
     groq_api_key: str = Field(default="", alias="GROQ_API_KEY")
     pexels_api_key: str = Field(default="", alias="PEXELS_API_KEY")
     pixabay_api_key: str = Field(default="", alias="PIXABAY_API_KEY")
+    footage_search_concurrency: int = Field(
+        default=16, alias="FOOTAGE_SEARCH_CONCURRENCY"
+    )
+    footage_download_concurrency: int = Field(
+        default=8, alias="FOOTAGE_DOWNLOAD_CONCURRENCY"
+    )
 
     # AWS Configuration
     aws_region: str = Field(default="us-east-1", alias="AWS_REGION")
@@ -54,8 +67,55 @@ class Settings(BaseSettings):
     s3_bucket: str = Field(default="aive-rendered-videos", alias="S3_BUCKET")
     use_lambda_rendering: bool = Field(default=False, alias="USE_LAMBDA_RENDERING")
 
+    # Local Rendering
+    # "auto" uses NVENC when the GPU encoder works, otherwise libx264
+    video_encoder: str = Field(default="auto", alias="VIDEO_ENCODER")
+    # Renders per worker times encoder threads should not exceed the CPU count
+    render_concurrency: int = Field(
+        default_factory=lambda: max(1, (os.cpu_count() or 1) // 4),
+        alias="RENDER_CONCURRENCY",
+    )
+    render_encoder_threads: int = Field(default=4, alias="RENDER_ENCODER_THREADS")
+
+    # Task Queue (Celery)
+    redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
+    celery_broker_url_override: str | None = Field(
+        default=None, alias="CELERY_BROKER_URL"
+    )
+    celery_result_backend_override: str | None = Field(
+        default=None, alias="CELERY_RESULT_BACKEND"
+    )
+    render_queue: str = Field(default="render_queue", alias="RENDER_QUEUE")
+
+    @property
+    def celery_broker_url(self) -> str:
+        """Get the Celery broker URL, defaulting to Redis."""
+        return self.celery_broker_url_override or self.redis_url
+
+    @property
+    def celery_result_backend(self) -> str:
+        """Get the Celery result backend URL, defaulting to Redis."""
+        return self.celery_result_backend_override or self.redis_url
+
+    # Caching
+    footage_cache_ttl: int = Field(default=86400, alias="FOOTAGE_CACHE_TTL")  # 24h
+    transcription_cache_ttl: int = Field(
+        default=2592000, alias="TRANSCRIPTION_CACHE_TTL"
+    )  # 30 days
+    render_status_cache_ttl: int = Field(
+        default=2, alias="RENDER_STATUS_CACHE_TTL"
+    )  # 2s
+
     # File Storage
     max_upload_size: int = Field(default=104857600, alias="MAX_UPLOAD_SIZE")  # 100MB
+    temp_file_max_age: int = Field(default=3600, alias="TEMP_FILE_MAX_AGE")  # 1h
+    temp_cleanup_interval: int = Field(
+        default=900, alias="TEMP_CLEANUP_INTERVAL"
+    )  # 15min
+    # Per-render scratch files; defaults to tmpfs when /dev/shm is available
+    render_scratch_dir_override: str | None = Field(
+        default=None, alias="RENDER_SCRATCH_DIR"
+    )
     allowed_audio_types: list[str] = Field(
         default=["audio/mpeg", "audio/mp3", "audio/wav", "audio/x-wav"],
         alias="ALLOWED_AUDIO_TYPES",
@@ -103,21 +163,44 @@ class Settings(BaseSettings):
         """Get the temporary files directory."""
         return self.static_dir / "temp"
 
+    @property
+    def render_scratch_dir(self) -> Path:
+        """Get the directory for per-render scratch files."""
+        if self.render_scratch_dir_override:
+            return Path(self.render_scratch_dir_override)
+        shm_dir = Path("/dev/shm")
+        if shm_dir.is_dir():
+            return shm_dir / "aive"
+        return self.temp_dir
+
     @property
     def audio_dir(self) -> Path:
         """Get the audio files directory."""
         return self.static_dir / "audio"
 
+    @property
+    def uploads_dir(self) -> Path:
+        """Get the directory for uploaded project audio files."""
+        return self.static_dir / "uploads"
+
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
-        directories = [self.static_dir, self.output_dir, self.temp_dir, self.audio_dir]
+        directories = [
+            self.static_dir,
+            self.output_dir,
+            self.temp_dir,
+            self.audio_dir,
+            self.uploads_dir,
+        ]
         for directory in directories:
             directory.mkdir(exist_ok=True, parents=True)
 
 
 @lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    settings = Settings()
-    settings.ensure_directories()
-    return settings
+    """Get cached settings instance.
+
+    Directories are not created here; entry points call ensure_directories()
+    once at startup.
+    """
+    return Settings()
@@ -17,12 +17,14 @@ class BaseController[RepositoryType: BaseRepository]:
     async def create_entity(self, session: AsyncSession, data: dict[str, Any]) -> Any:
         """Create a new entity with common validation and error handling."""
         try:
-            return await self.repository.create(session, data)
+            entity = await self.repository.create(session, data)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to create entity: {str(e)}",
             ) from e
+        self._known_ids(session).add(entity.id)
+        return entity
 
     async def get_entity(self, session: AsyncSession, entity_id: Any) -> Any:
         """Get an entity with common error handling."""
@@ -32,6 +34,7 @@ class BaseController[RepositoryType: BaseRepository]:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Entity with ID {entity_id} not found",
             )
+        self._known_ids(session).add(entity_id)
         return entity
 
     async def get_entities(
@@ -55,10 +58,7 @@ class BaseController[RepositoryType: BaseRepository]:
     ) -> Any:
         """Update an entity with common validation and error handling."""
         try:
-            # First check if entity exists
-            await self.get_entity(session, entity_id)
-
-            # Perform the update
+            # Perform the update (returns None if the entity doesn't exist)
             updated_entity = await self.repository.update(session, entity_id, data)
             if not updated_entity:
                 raise HTTPException(
@@ -77,11 +77,9 @@ class BaseController[RepositoryType: BaseRepository]:
     async def delete_entity(self, session: AsyncSession, entity_id: Any) -> bool:
         """Delete an entity with common validation and error handling."""
         try:
-            # First check if entity exists
-            await self.get_entity(session, entity_id)
-
-            # Perform the deletion
+            # Perform the deletion (returns False if the entity doesn't exist)
             success = await self.repository.delete(session, entity_id)
+            self._known_ids(session).discard(entity_id)
             if not success:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -99,13 +97,26 @@ class BaseController[RepositoryType: BaseRepository]:
     async def validate_entity_exists(
         self, session: AsyncSession, entity_id: Any
     ) -> None:
-        """Validate that an entity exists, raise 404 if not found."""
+        """Validate that an entity exists, raise 404 if not found.
+
+        IDs already seen on this session are not checked again, so repeated
+        validation within one request costs a single query.
+        """
+        known_ids = self._known_ids(session)
+        if entity_id in known_ids:
+            return
         exists = await self.repository.exists(session, entity_id)
         if not exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Entity with ID {entity_id} not found",
             )
+        known_ids.add(entity_id)
+
+    def _known_ids(self, session: AsyncSession) -> set[Any]:
+        """Get the IDs of this controller's entities known to exist on the session."""
+        key = ("known_ids", self.repository.model.__name__)
+        return session.info.setdefault(key, set())
 
     async def count_entities(
         self, session: AsyncSession, filters: dict[str, Any] | None = None
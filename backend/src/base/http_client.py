@@ -0,0 +1,25 @@
+"""
+Shared HTTP client for calls to external APIs (Groq, Pexels).
+
+A single pooled client keeps connections alive between requests instead of
+paying a TCP+TLS handshake on every call.
+"""
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache
+def get_http_client() -> httpx.AsyncClient:
+    """Get the cached shared HTTP client instance."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and drop the cached instance."""
+    await get_http_client().aclose()
+    get_http_client.cache_clear()
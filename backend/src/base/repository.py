@@ -1,5 +1,7 @@
 from typing import Any, TypeVar
 
+from sqlalchemy import bindparam, delete, insert, update
+from sqlalchemy import exists as sql_exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel, select
 
@@ -7,25 +9,66 @@ ModelType = TypeVar("ModelType", bound=SQLModel)
 
 
 class BaseRepository[ModelType: SQLModel]:
-    """Base repository class with common CRUD operations."""
+    """Base repository class with common CRUD operations.
 
-    def __init__(self, model: type[ModelType]):
+    Values passed in are stored as given; schemas are dumped with
+    model_dump(mode="json") so URLs and other nested types arrive as plain
+    JSON-compatible values.
+    """
+
+    def __init__(
+        self,
+        model: type[ModelType],
+        writable_columns: frozenset[str] | None = None,
+    ):
         self.model = model
+        # Columns update() may set; defaults to every non-primary-key column
+        self.writable_columns = writable_columns or frozenset(
+            column.name
+            for column in self.model.__table__.columns  # type: ignore
+            if not column.primary_key
+        )
+        # Built once per repository; only the bound ID changes between calls
+        self._get_statement = select(self.model).where(
+            self.model.id == bindparam("id")  # type: ignore
+        )
 
     async def create(self, session: AsyncSession, obj_in: dict[str, Any]) -> ModelType:
-        """Create a new object in the database."""
-        # Convert HttpUrl objects to strings for JSON serialization
-        processed_obj_in = self._process_httourls(obj_in)
-        db_obj = self.model(**processed_obj_in)
+        """Create a new object in the database.
+
+        Every column default, timestamps included, is filled in client-side,
+        so the object is returned as committed without a refresh.
+        """
+        db_obj = self.model(**obj_in)
         session.add(db_obj)
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
+    async def create_many(
+        self, session: AsyncSession, objs_in: list[dict[str, Any]], **common: Any
+    ) -> list[ModelType]:
+        """Create multiple objects in the database with a single commit.
+
+        Values in `common` (e.g. a shared foreign key) are applied to every
+        object. The rows are sent as one bulk INSERT ... RETURNING, which
+        SQLAlchemy batches into multi-row statements, and the created objects
+        come back in the order of `objs_in`.
+        """
+        if not objs_in:
+            return []
+
+        rows = [{**obj_in, **common} for obj_in in objs_in]
+        statement = insert(self.model).returning(
+            self.model, sort_by_parameter_order=True
+        )
+        result = await session.scalars(statement, rows)
+        db_objs = list(result.all())
+        await session.commit()
+        return db_objs
+
     async def get(self, session: AsyncSession, id: Any) -> ModelType | None:
         """Get an object by ID."""
-        statement = select(self.model).where(self.model.id == id)  # type: ignore
-        result = await session.execute(statement)
+        result = await session.execute(self._get_statement, {"id": id})
         return result.scalar_one_or_none()
 
     async def get_all(
@@ -50,39 +93,67 @@ class BaseRepository[ModelType: SQLModel]:
         result = await session.execute(statement)
         return list(result.scalars().all())
 
+    async def get_rows_grouped_by(
+        self, session: AsyncSession, key: str, values: list[Any]
+    ) -> dict[Any, list[dict[str, Any]]]:
+        """Get rows whose `key` column is in `values`, grouped by that column.
+
+        Loads the related rows of many parents with a single IN query.
+        """
+        grouped: dict[Any, list[dict[str, Any]]] = {value: [] for value in values}
+        if not values:
+            return grouped
+
+        table = self.model.__table__  # type: ignore
+        statement = table.select().where(table.c[key].in_(values))
+        result = await session.execute(statement)
+        for row in result.mappings():
+            grouped[row[key]].append(dict(row))
+        return grouped
+
     async def update(
         self, session: AsyncSession, id: Any, obj_in: dict[str, Any]
     ) -> ModelType | None:
-        """Update an object by ID."""
-        db_obj = await self.get(session, id)
-        if not db_obj:
-            return None
-
-        # Convert HttpUrl objects to strings for JSON serialization
-        processed_obj_in = self._process_httourls(obj_in)
+        """Update an object by ID.
 
-        for key, value in processed_obj_in.items():
-            if hasattr(db_obj, key):
-                setattr(db_obj, key, value)
+        Runs a single UPDATE ... RETURNING, so the object is neither loaded
+        before the update nor refreshed after it. Keys outside
+        `writable_columns` are ignored.
+        """
+        values = {key: obj_in[key] for key in obj_in.keys() & self.writable_columns}
+        return await self._update_returning(session, id, values)
 
+    async def _update_returning(
+        self, session: AsyncSession, id: Any, values: dict[str, Any]
+    ) -> ModelType | None:
+        """Apply column values to an object by ID and return the updated object."""
+        if not values:
+            return await self.get(session, id)
+
+        statement = (
+            update(self.model)
+            .where(self.model.id == id)  # type: ignore
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        result = await session.execute(statement)
+        db_obj = result.scalar_one_or_none()
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def delete(self, session: AsyncSession, id: Any) -> bool:
-        """Delete an object by ID."""
-        db_obj = await self.get(session, id)
-        if not db_obj:
-            return False
-
-        await session.delete(db_obj)
+        """Delete an object by ID. Returns False if it did not exist."""
+        statement = delete(self.model).where(self.model.id == id)  # type: ignore
+        result = await session.execute(statement)
         await session.commit()
-        return True
+        return result.rowcount > 0  # type: ignore
 
     async def exists(self, session: AsyncSession, id: Any) -> bool:
-        """Check if an object exists by ID."""
-        db_obj = await self.get(session, id)
-        return db_obj is not None
+        """Check if an object exists by ID without loading its columns."""
+        statement = select(sql_exists().where(self.model.id == id))  # type: ignore
+        result = await session.execute(statement)
+        return bool(result.scalar())
 
     async def count(
         self, session: AsyncSession, filters: dict[str, Any] | None = None
@@ -100,31 +171,3 @@ class BaseRepository[ModelType: SQLModel]:
 
         result = await session.execute(statement)
         return result.scalar_one()
-
-    def _process_httourls(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Recursively convert HttpUrl objects to strings for JSON serialization."""
-        from pydantic import HttpUrl
-
-        processed_data = {}
-        for key, value in data.items():
-            if isinstance(value, HttpUrl):
-                processed_data[key] = str(value)
-            elif isinstance(value, dict):
-                processed_data[key] = self._process_httourls(value)
-            elif isinstance(value, list):
-                processed_data[key] = [
-                    (
-                        self._process_httourls(item)
-                        if isinstance(item, dict)
-                        else (
-                            str(item)
-                            if hasattr(item, "__class__")
-                            and item.__class__.__name__ == "HttpUrl"
-                            else item
-                        )
-                    )
-                    for item in value
-                ]
-            else:
-                processed_data[key] = value
-        return processed_data
@@ -21,11 +21,25 @@ __all__ = [
 # Get settings
 settings = get_settings()
 
+# Pool tuning only applies to server databases; SQLite picks its own pool
+pool_options = (
+    {}
+    if settings.database_url.startswith("sqlite")
+    else {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_recycle": settings.database_pool_recycle,
+        # Replace connections dropped by the server while idle in the pool
+        "pool_pre_ping": True,
+    }
+)
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    **pool_options,
 )
 
 # Create async session factory
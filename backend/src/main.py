@@ -6,6 +6,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+# Close the clients the routes and services actually use; they import these
+# modules without the src. prefix, which gives separate module objects
+from base.cache import close_cache
+from base.http_client import close_http_client
 from src.base.config import get_settings
 from src.database.session import close_db, create_db_and_tables
 
@@ -33,16 +37,16 @@ async def lifespan(app: FastAPI):
     await create_db_and_tables()
     logger.info("Database tables created successfully")
 
-    # Ensure directories exist
-    settings.ensure_directories()
-    logger.info("Required directories ensured")
-
     yield
 
     # Shutdown
     logger.info("Shutting down AIVE Backend API...")
     await close_db()
     logger.info("Database connections closed")
+    await close_cache()
+    logger.info("Cache connections closed")
+    await close_http_client()
+    logger.info("HTTP client closed")
 
 
 # Create FastAPI app
@@ -80,6 +84,9 @@ async def options_handler(request: Request, full_path: str):
     )
 
 
+# Ensure directories exist before the static directories are mounted
+settings.ensure_directories()
+
 # Mount static files for videos
 try:
     app.mount(
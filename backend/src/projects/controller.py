@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any
 
 from fastapi import HTTPException, status
@@ -40,36 +41,103 @@ class ProjectController(BaseController[ProjectRepository]):
                 detail="Audio file path is required",
             )
 
-        # Check if project with same title already exists and make it unique
-        original_title = project_data.title
+        # Check if project with same title already exists and make it unique,
+        # loading all candidate titles with one query
+        original_title = project_data.title.strip()
+        taken_titles = await self.repository.get_titles_like(session, original_title)
+        title = original_title
         counter = 1
-        while True:
-            existing_project = await self.repository.get_by_title(
-                session, project_data.title
-            )
-            if not existing_project:
-                break
+        while title in taken_titles:
             # Append counter to make title unique
             counter += 1
-            project_data.title = f"{original_title} ({counter})"
+            title = f"{original_title} ({counter})"
+        project_data.title = title
 
-        # Create the project
-        project_dict = project_data.model_dump()
-        return await self.repository.create(session, project_dict)
+        # Create the project; the sentences and music added next need no
+        # separate existence check
+        project_dict = project_data.model_dump(mode="json")
+        project = await self.repository.create(session, project_dict)
+        self._known_ids(session).add(project.id)
+        return project
 
     async def get_project_with_details(
         self, session: AsyncSession, project_id: str
     ) -> dict[str, Any]:
         """Get project with all related data (sentences, footage choices, music)."""
-        # Get the project
         project: Project = await self.get_entity(session, project_id)
+        return await self._build_project_details(session, project)
+
+    async def update_project_with_details(
+        self, session: AsyncSession, project_id: str, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Update a project and return it with all related data.
+
+        The response is built from the updated row, so the project is not
+        fetched again after the update.
+        """
+        project: Project = await self.update_entity(session, project_id, data)
+        return await self._build_project_details(session, project)
+
+    async def get_projects_with_details(
+        self,
+        session: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get a page of projects, newest first, with all related data."""
+        projects = await self.repository.get_page(session, limit, skip, after)
+        return await self._build_projects_details(session, projects)
+
+    async def _build_project_details(
+        self, session: AsyncSession, project: Project
+    ) -> dict[str, Any]:
+        """Build the project details response, loading the related data."""
+        [project_dict] = await self._build_projects_details(session, [project])
+        return project_dict
+
+    async def _build_projects_details(
+        self, session: AsyncSession, projects: list[Project]
+    ) -> list[dict[str, Any]]:
+        """Build details responses for several projects.
 
-        # Get all related data
-        sentences = await self.sentence_repo.get_by_project_id(session, project_id)
-        footage_choices = await self.footage_repo.get_by_project_id(session, project_id)
-        music_recommendations = await self.music_repo.get_by_project_id(
-            session, project_id
+        Related data is loaded with one query per table for all projects.
+        """
+        project_ids = [project.id for project in projects]
+
+        # Get all related data as plain rows, grouped by project
+        sentences_by_project = await self.sentence_repo.get_rows_grouped_by(
+            session, "project_id", project_ids
+        )
+        footage_by_project = await self.footage_repo.get_rows_grouped_by(
+            session, "project_id", project_ids
         )
+        music_by_project = await self.music_repo.get_rows_grouped_by(
+            session, "project_id", project_ids
+        )
+
+        return [
+            self._project_to_details(
+                project,
+                sentences_by_project[project.id],
+                footage_by_project[project.id],
+                music_by_project[project.id],
+            )
+            for project in projects
+        ]
+
+    def _project_to_details(
+        self,
+        project: Project,
+        sentences: list[dict[str, Any]],
+        footage_choices: list[dict[str, Any]],
+        music_recommendations: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Convert a project and its related rows to the details response."""
+        for sentence in sentences:
+            sentence["selected_footage"] = self._parse_selected_footage(
+                sentence["selected_footage"]
+            )
 
         # Convert to response format
         project_dict = {
@@ -84,24 +152,31 @@ class ProjectController(BaseController[ProjectRepository]):
             "videoUrl": project.video_url,
             "created_at": project.created_at.isoformat(),
             "updated_at": project.updated_at.isoformat(),
-            "sentences": [self._sentence_to_dict(s) for s in sentences],
+            "sentences": sentences,
             "total_sentences": len(sentences),
-            "footage_choices": [
-                self._footage_choice_to_dict(fc) for fc in footage_choices
-            ],
-            "music_recommendations": [
-                self._music_recommendation_to_dict(mr) for mr in music_recommendations
-            ],
+            "footage_choices": footage_choices,
+            "music_recommendations": music_recommendations,
         }
 
         # Calculate total duration from sentences if not set
         if not project_dict["total_duration"] and sentences:
             project_dict["total_duration"] = sum(
-                s.end_time - s.start_time for s in sentences
+                s["end_time"] - s["start_time"] for s in sentences
             )
 
         return project_dict
 
+    async def validate_ready_for_render(
+        self, session: AsyncSession, project_id: str
+    ) -> None:
+        """Validate that a project exists and every sentence has footage selected."""
+        await self.validate_entity_exists(session, project_id)
+        if await self.sentence_repo.has_missing_footage(session, project_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Not all sentences have selected footage. Please select footage for all sentences.",
+            )
+
     async def add_sentences_to_project(
         self,
         session: AsyncSession,
@@ -111,8 +186,9 @@ class ProjectController(BaseController[ProjectRepository]):
         """Add sentences to a project."""
         # Validate project exists
         await self.validate_entity_exists(session, project_id)
-        # Convert to dict format
-        sentences_dict = [s.model_dump() for s in sentences_data]
+        # Convert to dict format; JSON mode serializes the nested selected
+        # footage in pydantic-core
+        sentences_dict = [s.model_dump(mode="json") for s in sentences_data]
         # Create sentences
         sentences = await self.sentence_repo.create_multiple(
             session, project_id, sentences_dict
@@ -129,7 +205,7 @@ class ProjectController(BaseController[ProjectRepository]):
         # Validate project exists
         await self.validate_entity_exists(session, project_id)
         # Convert to dict format
-        choices_dict = [fc.model_dump() for fc in footage_choices_data]
+        choices_dict = [fc.model_dump(mode="json") for fc in footage_choices_data]
         # Create footage choices
         choices = await self.footage_repo.create_multiple(
             session, project_id, choices_dict
@@ -146,7 +222,7 @@ class ProjectController(BaseController[ProjectRepository]):
         # Validate project exists
         await self.validate_entity_exists(session, project_id)
         # Convert to dict format
-        music_dict = [m.model_dump() for m in music_data]
+        music_dict = [m.model_dump(mode="json") for m in music_data]
         # Create music recommendations
         recommendations = await self.music_repo.create_multiple(
             session, project_id, music_dict
@@ -167,20 +243,25 @@ class ProjectController(BaseController[ProjectRepository]):
             )
         return self._sentence_to_dict(sentence)
 
+    async def update_sentences_footage(
+        self,
+        session: AsyncSession,
+        project_id: str,
+        selected_footage_by_id: dict[str, SelectedFootage],
+    ) -> list[dict[str, Any]]:
+        """Update selected footage for several sentences of a project."""
+        sentences = await self.sentence_repo.update_selected_footage_many(
+            session, project_id, selected_footage_by_id
+        )
+        if sentences is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Some sentences were not found in project {project_id}",
+            )
+        return [self._sentence_to_dict(s) for s in sentences]
+
     def _sentence_to_dict(self, sentence: Sentence) -> dict[str, Any]:
         """Convert sentence model to dict."""
-        # Ensure selected_footage is properly serialized as a dict
-        selected_footage = sentence.selected_footage
-        if selected_footage is not None:
-            # If it's already a dict, use it directly
-            # If it's a string (shouldn't happen with JSON column), parse it
-            if isinstance(selected_footage, str):
-                import json
-                try:
-                    selected_footage = json.loads(selected_footage)
-                except json.JSONDecodeError:
-                    selected_footage = None
-        
         return {
             "id": sentence.id,
             "project_id": sentence.project_id,
@@ -188,9 +269,24 @@ class ProjectController(BaseController[ProjectRepository]):
             "translated_text": sentence.translated_text,
             "start_time": sentence.start_time,
             "end_time": sentence.end_time,
-            "selected_footage": selected_footage,
+            "selected_footage": self._parse_selected_footage(
+                sentence.selected_footage
+            ),
         }
 
+    @staticmethod
+    def _parse_selected_footage(selected_footage: Any) -> dict[str, Any] | None:
+        """Ensure selected_footage is properly serialized as a dict."""
+        # If it's already a dict, use it directly
+        # If it's a string (shouldn't happen with JSON column), parse it
+        if isinstance(selected_footage, str):
+            import json
+            try:
+                return json.loads(selected_footage)
+            except json.JSONDecodeError:
+                return None
+        return selected_footage
+
     def _footage_choice_to_dict(self, footage_choice: FootageChoice) -> dict[str, Any]:
         """Convert footage choice model to dict."""
         return {
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, Text, func
+from sqlalchemy import DateTime, Index, Text, func
 from sqlmodel import JSON, Column, Field, SQLModel
 
 
@@ -9,6 +9,10 @@ class Project(SQLModel, table=True):
     """Project model representing a video creation project."""
 
     __tablename__: str = "projects"
+    __table_args__ = (
+        # Serves newest-first keyset pagination of the project listing
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
 
     id: str = Field(primary_key=True, max_length=50, index=True)
     title: str = Field(..., description="Project title")
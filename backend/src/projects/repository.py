@@ -1,18 +1,34 @@
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, or_, select, tuple_
+from sqlalchemy import exists as sql_exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from base.repository import BaseRepository
 from projects.models import FootageChoice, MusicRecommendation, Project, Sentence
 from projects.schemas import SelectedFootage
+from render.models import RenderTask
+
+# Project fields that may be changed through update(); IDs and timestamps
+# are managed by the application and the database
+PROJECT_WRITABLE_COLUMNS = frozenset(
+    {
+        "title",
+        "description",
+        "audio_file_path",
+        "total_duration",
+        "overall_mood",
+        "video_url",
+    }
+)
 
 
 class ProjectRepository(BaseRepository[Project]):
     """Repository for project-specific database operations."""
 
     def __init__(self):
-        super().__init__(Project)
+        super().__init__(Project, PROJECT_WRITABLE_COLUMNS)
 
     async def get_by_title(self, session: AsyncSession, title: str) -> Project | None:
         """Get a project by title."""
@@ -20,6 +36,58 @@ class ProjectRepository(BaseRepository[Project]):
         result = await session.execute(statement)
         return result.scalars().first()
 
+    async def get_page(
+        self,
+        session: AsyncSession,
+        limit: int = 100,
+        skip: int = 0,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[Project]:
+        """Get a page of projects, newest first.
+
+        Pass the (created_at, id) of the last project of the previous page as
+        `after` to seek straight to the next page instead of skipping rows.
+        """
+        statement = select(self.model).order_by(
+            self.model.created_at.desc(), self.model.id.desc()  # type: ignore
+        )
+        if after is not None:
+            statement = statement.where(
+                tuple_(self.model.created_at, self.model.id) < after  # type: ignore
+            )
+        else:
+            statement = statement.offset(skip)
+
+        result = await session.execute(statement.limit(limit))
+        return list(result.scalars().all())
+
+    async def get_titles_like(self, session: AsyncSession, title: str) -> set[str]:
+        """Get existing titles equal to `title` or numbered like `title (2)`."""
+        statement = select(self.model.title).where(  # type: ignore
+            or_(
+                self.model.title == title,  # type: ignore
+                self.model.title.startswith(f"{title} (", autoescape=True),  # type: ignore
+            )
+        )
+        result = await session.execute(statement)
+        return set(result.scalars().all())
+
+    async def delete(self, session: AsyncSession, id: Any) -> bool:
+        """Delete a project and its related rows in one transaction.
+
+        Children are removed with one bulk DELETE per table, in foreign key
+        order, before the project itself.
+        """
+        for model in (FootageChoice, Sentence, MusicRecommendation, RenderTask):
+            await session.execute(
+                delete(model).where(model.project_id == id)  # type: ignore
+            )
+        result = await session.execute(
+            delete(self.model).where(self.model.id == id)  # type: ignore
+        )
+        await session.commit()
+        return result.rowcount > 0  # type: ignore
+
 
 class SentenceRepository(BaseRepository[Sentence]):
     """Repository for sentence-specific database operations."""
@@ -35,65 +103,86 @@ class SentenceRepository(BaseRepository[Sentence]):
         result = await session.execute(statement)
         return list(result.scalars().all())
 
+    async def has_missing_footage(self, session: AsyncSession, project_id: str) -> bool:
+        """Check whether any sentence of a project has no selected footage URL."""
+        footage_url = func.coalesce(
+            self.model.selected_footage["url"].as_string(), ""  # type: ignore
+        )
+        statement = select(
+            sql_exists().where(
+                self.model.project_id == project_id,  # type: ignore
+                footage_url == "",
+            )
+        )
+        result = await session.execute(statement)
+        return bool(result.scalar())
+
     async def create_multiple(
         self,
         session: AsyncSession,
         project_id: str,
         sentences_data: list[dict[str, Any]],
     ) -> list[Sentence]:
-        """Create multiple sentences for a project."""
-        sentences = []
-        for sentence_data in sentences_data:
-            # Convert selected_footage to JSON if it exists
-            selected_footage_json = None
-            if (
-                "selected_footage" in sentence_data
-                and sentence_data["selected_footage"]
-            ):
-                if isinstance(sentence_data["selected_footage"], SelectedFootage):
-                    selected_footage_dict = sentence_data[
-                        "selected_footage"
-                    ].model_dump()
-                    # Convert HttpUrl to string for JSON serialization
-                    if "url" in selected_footage_dict:
-                        selected_footage_dict["url"] = str(selected_footage_dict["url"])
-                    selected_footage_json = selected_footage_dict
-                else:
-                    selected_footage_json = sentence_data["selected_footage"]
-
-            sentence_dict = {
-                **sentence_data,
-                "project_id": project_id,
-                "selected_footage": selected_footage_json,
-            }
-
-            sentence = Sentence(**sentence_dict)
-            sentences.append(sentence)
-            session.add(sentence)
+        """Create multiple sentences for a project.
 
-        await session.commit()
-        for sentence in sentences:
-            await session.refresh(sentence)
-
-        return sentences
+        Rows dumped from SentenceCreate already carry selected_footage as a
+        dict and are passed through as-is; only model instances are converted.
+        """
+        sentence_dicts = []
+        for sentence_data in sentences_data:
+            selected_footage = sentence_data.get("selected_footage")
+            if isinstance(selected_footage, SelectedFootage):
+                sentence_data = {
+                    **sentence_data,
+                    "selected_footage": self._serialize_selected_footage(
+                        selected_footage
+                    ),
+                }
+            sentence_dicts.append(sentence_data)
+
+        return await self.create_many(session, sentence_dicts, project_id=project_id)
 
     async def update_selected_footage(
         self, session: AsyncSession, sentence_id: str, selected_footage: SelectedFootage
     ) -> Sentence | None:
         """Update the selected footage for a sentence."""
-        sentence = await self.get(session, sentence_id)
-        if not sentence:
+        return await self._update_returning(
+            session,
+            sentence_id,
+            {"selected_footage": self._serialize_selected_footage(selected_footage)},
+        )
+
+    async def update_selected_footage_many(
+        self,
+        session: AsyncSession,
+        project_id: str,
+        selected_footage_by_id: dict[str, SelectedFootage],
+    ) -> list[Sentence] | None:
+        """Update the selected footage of several sentences of a project at once.
+
+        Returns None without writing anything if any sentence is not found.
+        """
+        statement = select(self.model).where(
+            self.model.project_id == project_id,  # type: ignore
+            self.model.id.in_(selected_footage_by_id),  # type: ignore
+        )
+        result = await session.execute(statement)
+        sentences = list(result.scalars().all())
+        if len(sentences) != len(selected_footage_by_id):
             return None
 
-        # Convert to dict and ensure HttpUrl objects are serialized as strings
-        selected_footage_dict = selected_footage.model_dump()
-        if "url" in selected_footage_dict:
-            selected_footage_dict["url"] = str(selected_footage_dict["url"])
+        for sentence in sentences:
+            sentence.selected_footage = self._serialize_selected_footage(
+                selected_footage_by_id[sentence.id]
+            )
 
-        sentence.selected_footage = selected_footage_dict
         await session.commit()
-        await session.refresh(sentence)
-        return sentence
+        return sentences
+
+    @staticmethod
+    def _serialize_selected_footage(selected_footage: SelectedFootage) -> dict[str, Any]:
+        """Convert selected footage to a JSON-ready dict."""
+        return selected_footage.model_dump(mode="json")
 
 
 class FootageChoiceRepository(BaseRepository[FootageChoice]):
@@ -125,18 +214,9 @@ class FootageChoiceRepository(BaseRepository[FootageChoice]):
         footage_choices_data: list[dict[str, Any]],
     ) -> list[FootageChoice]:
         """Create multiple footage choices for a project."""
-        choices = []
-        for choice_data in footage_choices_data:
-            choice_dict = {**choice_data, "project_id": project_id}
-            choice = FootageChoice(**choice_dict)
-            choices.append(choice)
-            session.add(choice)
-
-        await session.commit()
-        for choice in choices:
-            await session.refresh(choice)
-
-        return choices
+        return await self.create_many(
+            session, footage_choices_data, project_id=project_id
+        )
 
 
 class MusicRecommendationRepository(BaseRepository[MusicRecommendation]):
@@ -160,15 +240,6 @@ class MusicRecommendationRepository(BaseRepository[MusicRecommendation]):
         recommendations_data: list[dict[str, Any]],
     ) -> list[MusicRecommendation]:
         """Create multiple music recommendations for a project."""
-        recommendations = []
-        for rec_data in recommendations_data:
-            rec_dict = {**rec_data, "project_id": project_id}
-            recommendation = MusicRecommendation(**rec_dict)
-            recommendations.append(recommendation)
-            session.add(recommendation)
-
-        await session.commit()
-        for recommendation in recommendations:
-            await session.refresh(recommendation)
-
-        return recommendations
+        return await self.create_many(
+            session, recommendations_data, project_id=project_id
+        )
@@ -1,9 +1,11 @@
-import os
+import asyncio
+from datetime import datetime
 from typing import Any
 
+import aiofiles
+import aiofiles.os
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     File,
     HTTPException,
@@ -18,26 +20,35 @@ from projects.schemas import (
     FootageChoices,
     MusicResponse,
     ProjectCreate,
+    SelectedFootage,
 )
+from render.controller import RenderController
 
 router = APIRouter()
 controller = ProjectController()
+render_controller = RenderController()
+
+# Size of each chunk read from an uploaded file when streaming it to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
 
 
 @router.get("/", response_model=list[dict[str, Any]])
 async def get_all_projects(
-    skip: int = 0, limit: int = 100, session: AsyncSession = Depends(get_session)
+    skip: int = 0,
+    limit: int = 100,
+    after_created_at: datetime | None = None,
+    after_id: str | None = None,
+    session: AsyncSession = Depends(get_session),
 ):
-    """Get a list of all projects."""
-    projects = await controller.get_entities(session, skip, limit)
-
-    # Convert to response format with additional details
-    result = []
-    for project in projects:
-        project_details = await controller.get_project_with_details(session, project.id)
-        result.append(project_details)
+    """Get a list of all projects, newest first.
 
-    return result
+    For deep pages pass the created_at and id of the last project received
+    as after_created_at and after_id instead of skip.
+    """
+    after = None
+    if after_created_at is not None and after_id is not None:
+        after = (after_created_at, after_id)
+    return await controller.get_projects_with_details(session, skip, limit, after)
 
 
 @router.get("/{project_id}", response_model=dict[str, Any])
@@ -53,12 +64,15 @@ async def create_project(
     audio_file: UploadFile = File(...), session: AsyncSession = Depends(get_session)
 ):
     """Create a new project with audio file upload, transcription, and footage recommendations."""
-    import os
-    import shutil
+    import hashlib
 
     from base.config import get_settings
-    from projects.schemas import SelectedFootage, SentenceCreate, generate_id
-    from video_processing.services import find_footage_for_sentence, transcribe_audio
+    from projects.schemas import SentenceCreate, generate_id
+    from video_processing.services import (
+        find_footage_for_sentences,
+        generate_project_title,
+        transcribe_audio,
+    )
 
     settings = get_settings()
 
@@ -69,17 +83,35 @@ async def create_project(
             detail=f"File type not allowed. Supported types: {settings.allowed_audio_types}",
         )
 
-    # Generate project ID and save audio file
+    # Generate project ID and save audio file. The upload is staged in the temp
+    # directory and only moved into the uploads directory once complete.
     project_id = generate_id("proj")
-    audio_path = settings.temp_dir / f"{project_id}_{audio_file.filename}"
+    audio_path = settings.uploads_dir / f"{project_id}_{audio_file.filename}"
+    partial_path = settings.temp_dir / f"{audio_path.name}.part"
 
     try:
-        # Save the audio file
-        with open(audio_path, "wb") as buffer:
-            shutil.copyfileobj(audio_file.file, buffer)
+        # Stream the audio file to disk in chunks, enforcing the upload size limit
+        # and hashing the content in the same pass (used as the transcription cache key)
+        bytes_written = 0
+        audio_hash = hashlib.sha256()
+        async with aiofiles.open(partial_path, "wb") as out:
+            while chunk := await audio_file.read(UPLOAD_CHUNK_SIZE):
+                bytes_written += len(chunk)
+                if bytes_written > settings.max_upload_size:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large. Maximum size: {settings.max_upload_size} bytes",
+                    )
+                audio_hash.update(chunk)
+                await out.write(chunk)
+
+        # Move the complete upload into place atomically
+        await aiofiles.os.replace(partial_path, audio_path)
 
         # Transcribe audio to get sentences with timestamps
-        sentences_data = await transcribe_audio(str(audio_path))
+        sentences_data = await transcribe_audio(
+            str(audio_path), audio_hash=audio_hash.hexdigest()
+        )
 
         if not sentences_data:
             raise HTTPException(
@@ -87,53 +119,43 @@ async def create_project(
                 detail="Failed to transcribe audio",
             )
 
-        # For each sentence, find recommended footage and set as selected by default
-        sentences_create = []
-        for sentence_data in sentences_data:
-            # Find footage for this sentence
-            footage_url = await find_footage_for_sentence(
-                sentence_data["text"], sentence_data.get("translated_text")
-            )
-
-            # Create default selected footage from recommendation
-            selected_footage = None
-            if footage_url:
-                selected_footage = SelectedFootage(
-                    id=f"footage-{len(sentences_create)}-recommended",
-                    title=f"{sentence_data['text'][:35]}{'...' if len(sentence_data['text']) > 35 else ''}",
-                    description="AI-recommended footage from Pexels based on content analysis",
-                    thumbnail="/placeholder.svg",
-                    duration=sentence_data["end"] - sentence_data["start"],
-                    tags=["ai-recommended", "pexels", "relevant"],
-                    category="recommended",
-                    mood="neutral",
-                    relevance_score=95,
-                    url=str(
-                        footage_url
-                    ),  # Convert to string to avoid HttpUrl serialization issues
-                )
+        # Find recommended footage for all sentences concurrently, and generate
+        # the AI title from the sentence texts while the lookups are running
+        sentence_texts = [s["text"] for s in sentences_data]
+        footage_urls, ai_title = await asyncio.gather(
+            find_footage_for_sentences(sentences_data),
+            generate_project_title(sentence_texts),
+        )
 
-            # Create sentence object
-            sentence_create = SentenceCreate(
+        # For each sentence, set the recommended footage as selected by default
+        sentences_create = [
+            SentenceCreate(
                 text=sentence_data["text"],
                 translated_text=sentence_data.get("translated_text"),
                 start_time=sentence_data["start"],
                 end_time=sentence_data["end"],
-                selected_footage=selected_footage,
+                selected_footage=(
+                    SelectedFootage.recommended(
+                        index,
+                        sentence_data["text"],
+                        sentence_data["end"] - sentence_data["start"],
+                        str(footage_url),
+                    )
+                    if footage_url
+                    else None
+                ),
             )
-            sentences_create.append(sentence_create)
-
-        # Generate AI title from sentence texts
-        from video_processing.services import generate_project_title
-
-        sentence_texts = [s["text"] for s in sentences_data]
-        ai_title = await generate_project_title(sentence_texts)
+            for index, (sentence_data, footage_url) in enumerate(
+                zip(sentences_data, footage_urls, strict=True)
+            )
+        ]
 
-        # Create project data
+        # Create project data, with the duration taken from the transcript
         project_data = ProjectCreate(
             id=project_id,
             title=ai_title,
             audio_file_path=str(audio_path),
+            total_duration=sum(s["end"] - s["start"] for s in sentences_data),
         )
 
         # Create the project
@@ -171,8 +193,9 @@ async def create_project(
 
     except Exception as e:
         # Clean up any created files
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
+        for path in (partial_path, audio_path):
+            if await aiofiles.os.path.exists(path):
+                await aiofiles.os.remove(path)
 
         if isinstance(e, HTTPException):
             raise
@@ -183,6 +206,19 @@ async def create_project(
         ) from e
 
 
+@router.delete("/transcription-cache/{audio_hash}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_transcription_cache(audio_hash: str):
+    """Drop a cached transcription by the SHA-256 of its audio content."""
+    from video_processing.services import invalidate_transcription_cache
+
+    if not await invalidate_transcription_cache(audio_hash):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No cached transcription for audio hash {audio_hash}",
+        )
+    return None
+
+
 @router.put("/{project_id}", response_model=dict[str, Any])
 async def update_project(
     project_id: str,
@@ -190,8 +226,9 @@ async def update_project(
     session: AsyncSession = Depends(get_session),
 ):
     """Update a project by ID."""
-    await controller.update_entity(session, project_id, project_data)
-    return await controller.get_project_with_details(session, project_id)
+    return await controller.update_project_with_details(
+        session, project_id, project_data
+    )
 
 
 @router.patch("/{project_id}", response_model=dict[str, Any])
@@ -201,8 +238,9 @@ async def patch_project(
     session: AsyncSession = Depends(get_session),
 ):
     """Partially update a project by ID."""
-    await controller.update_entity(session, project_id, project_data)
-    return await controller.get_project_with_details(session, project_id)
+    return await controller.update_project_with_details(
+        session, project_id, project_data
+    )
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -225,53 +263,36 @@ async def submit_footage_choices(
     # Validate project exists
     await controller.validate_entity_exists(session, project_id)
 
-    # Process footage choices and update sentences
-    for choice in footage_choices.footage_choices:
-        # Create selected footage object
-        selected_footage = {
-            "id": f"footage-{choice.sentence_id}-selected",
-            "title": f"User-selected footage for sentence {choice.sentence_id}",
-            "description": "User-selected footage from Pexels",
-            "thumbnail": "/placeholder.svg",
-            "duration": 10.0,  # Default duration
-            "tags": ["user-selected", "pexels"],
-            "category": "user-selected",
-            "mood": "neutral",
-            "relevance_score": 100,  # User selected is always most relevant
-            "url": choice.footage_url,
-        }
-
-        # Update the sentence with the selected footage
-        from projects.schemas import SelectedFootage
-
-        selected_footage_obj = SelectedFootage(**selected_footage)
-        await controller.update_sentence_footage(
-            session, choice.sentence_id, selected_footage_obj
+    # Process footage choices and update all sentences in one batch
+    selected_footage_by_id = {
+        choice.sentence_id: SelectedFootage.user_selected(
+            choice.sentence_id, choice.footage_url
         )
+        for choice in footage_choices.footage_choices
+    }
+    await controller.update_sentences_footage(
+        session, project_id, selected_footage_by_id
+    )
 
     # Create and save footage choices to database
-    footage_choices_create = []
-    for choice in footage_choices.footage_choices:
-        footage_choice_create = FootageChoiceCreate(
+    footage_choices_create = [
+        FootageChoiceCreate(
             sentence_id=choice.sentence_id,
             footage_options=[{"url": choice.footage_url, "selected": True}],
         )
-        footage_choices_create.append(footage_choice_create)
+        for choice in footage_choices.footage_choices
+    ]
 
     await controller.add_footage_choices(session, project_id, footage_choices_create)
 
-    # Get all sentences to find background music
-    project_details = await controller.get_project_with_details(session, project_id)
-    sentence_texts = [s["text"] for s in project_details["sentences"]]
-
-    # Find background music recommendations
-    music_tracks = await find_background_music(sentence_texts)
+    # Find background music recommendations. The local library lookup does
+    # not depend on the sentence texts, so the project is not read back here.
+    music_tracks = await find_background_music()
 
     # Save music recommendations to database
     if music_tracks:
-        music_recs_create = []
-        for track in music_tracks:
-            music_rec = MusicRecommendationCreate(
+        music_recs_create = [
+            MusicRecommendationCreate(
                 title=track["name"],
                 artist="AI Generated",
                 genre="Ambient",
@@ -280,7 +301,8 @@ async def submit_footage_choices(
                 url=track["url"],
                 duration=60.0,  # Default duration
             )
-            music_recs_create.append(music_rec)
+            for track in music_tracks
+        ]
 
         await controller.add_music_recommendations(
             session, project_id, music_recs_create
@@ -289,129 +311,19 @@ async def submit_footage_choices(
     # Convert music tracks to response format
     from projects.schemas import MusicRecommendation
 
-    music_recommendations = []
-    for track in music_tracks:
-        music_rec = MusicRecommendation(
-            id=track["id"], name=track["name"], url=track["url"]
-        )
-        music_recommendations.append(music_rec)
+    music_recommendations = [
+        MusicRecommendation(id=track["id"], name=track["name"], url=track["url"])
+        for track in music_tracks
+    ]
 
     return MusicResponse(project_id=project_id, recommended_music=music_recommendations)
 
 
-@router.post("/{project_id}/render", status_code=status.HTTP_202_ACCEPTED)
-async def render_project(
-    project_id: str,
-    background_tasks: BackgroundTasks,
-    session: AsyncSession = Depends(get_session),
-):
-    """Start rendering a video for a project."""
-    from render.controller import RenderController
-    from render.schemas import RenderRequest
-
-    # Create a minimal render request (can be enhanced later)
-    render_request = RenderRequest()
-    render_controller = RenderController()
-
-    # Validate project exists and get project data
-    project_details = await controller.get_project_with_details(session, project_id)
-
-    # Check if all sentences have selected footage
-    sentences = project_details["sentences"]
-    if not all(
-        s.get("selected_footage") and s["selected_footage"].get("url")
-        for s in sentences
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Not all sentences have selected footage. Please select footage for all sentences.",
-        )
-
-    # Create render task
-    render_task = await render_controller.create_render_task(
-        session, project_id, render_request
-    )
-
-    # Define the background rendering function
-    async def render_video_task():
-        # Create a new session for the background task
-        from database.session import async_session_factory
-
-        async with async_session_factory() as bg_session:
-            try:
-                # Update status to processing
-                await render_controller.update_render_status(
-                    bg_session, render_task.id, "processing", progress=10
-                )
-
-                # Get audio file path from project
-                audio_file_path = project_details["audio_file_path"]
-                if not audio_file_path or not os.path.exists(audio_file_path):
-                    await render_controller.update_render_status(
-                        bg_session,
-                        render_task.id,
-                        "failed",
-                        error_message="Audio file not found",
-                    )
-                    return
-
-                # Update progress
-                await render_controller.update_render_status(
-                    bg_session, render_task.id, "processing", progress=25
-                )
-
-                # Update progress
-                await render_controller.update_render_status(
-                    bg_session, render_task.id, "processing", progress=40
-                )
-
-                # Create a mock video URL (replace with actual rendering later)
-                output_filename = f"{project_id}_final_video.mp4"
-                relative_path = f"/api/videos/{output_filename}"
-
-                # Update status to complete
-                await render_controller.update_render_status(
-                    bg_session,
-                    render_task.id,
-                    "complete",
-                    progress=100,
-                    video_url=relative_path,
-                )
-
-                # Update project with video URL
-                await controller.update_entity(
-                    bg_session, project_id, {"video_url": relative_path}
-                )
-
-            except Exception as e:
-                import logging
-
-                logging.getLogger(__name__).error(
-                    f"Error in render task {render_task.id}: {str(e)}"
-                )
-                await render_controller.update_render_status(
-                    bg_session, render_task.id, "failed", error_message=str(e)
-                )
-
-    # Add the rendering task to background tasks
-    background_tasks.add_task(render_video_task)
-
-    # Return response
-    return {
-        "render_task_id": render_task.id,
-        "status_url": f"/api/v1/render/status/{render_task.id}",
-        "message": "Render task started successfully",
-    }
-
-
 @router.get("/render/status/{task_id}")
 async def get_project_render_status(
     task_id: str, session: AsyncSession = Depends(get_session)
 ):
     """Get the status of a render task (project-scoped route)."""
-    from render.controller import RenderController
-
-    render_controller = RenderController()
     status_info = await render_controller.get_render_status(session, task_id)
 
     return {
@@ -444,8 +356,7 @@ async def generate_title_for_project(
     # Generate AI title
     ai_title = await generate_project_title(sentence_texts)
     
-    # Update project with new title
-    await controller.update_entity(session, project_id, {"title": ai_title})
-    
-    # Return updated project details
-    return await controller.get_project_with_details(session, project_id)
+    # Update project with new title and return updated project details
+    return await controller.update_project_with_details(
+        session, project_id, {"title": ai_title}
+    )
@@ -1,30 +1,85 @@
-import uuid
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import Any, ClassVar
+from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 def generate_id(prefix: str = "") -> str:
     """Generate unique IDs with prefix."""
-    return f"{prefix}-{str(uuid.uuid4())}"
+    return f"{prefix}-{uuid4()}"
 
 
 # Selected Footage Schema
+RECOMMENDED_FOOTAGE_TAGS = ("ai-recommended", "pexels", "relevant")
+USER_SELECTED_FOOTAGE_TAGS = ("user-selected", "pexels")
+
+
 class SelectedFootage(BaseModel):
-    """Schema for selected footage information."""
+    """Schema for selected footage information.
+
+    Instances are immutable, so they are hashable and can share tag tuples.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     id: str
     title: str
     description: str
     thumbnail: str
     duration: float
-    tags: list[str]
+    tags: tuple[str, ...]
     category: str
     mood: str
     relevance_score: int
     url: str  # Changed from HttpUrl to str to avoid JSON serialization issues
 
+    # Recommended footage titles are cut to this many characters of the sentence
+    TITLE_LENGTH: ClassVar[int] = 35
+
+    @classmethod
+    def recommended(
+        cls, index: int, text: str, duration: float, url: str
+    ) -> "SelectedFootage":
+        """Build the default footage recommended for a transcribed sentence.
+
+        All values are produced by the backend, so validation is skipped.
+        """
+        if len(text) > cls.TITLE_LENGTH:
+            text = text[: cls.TITLE_LENGTH] + "..."
+        return cls.model_construct(
+            id=f"footage-{index}-recommended",
+            title=text,
+            description="AI-recommended footage from Pexels based on content analysis",
+            thumbnail="/placeholder.svg",
+            duration=duration,
+            tags=RECOMMENDED_FOOTAGE_TAGS,
+            category="recommended",
+            mood="neutral",
+            relevance_score=95,
+            url=url,
+        )
+
+    @classmethod
+    def user_selected(cls, sentence_id: str, url: str) -> "SelectedFootage":
+        """Build the footage a user picked for a sentence.
+
+        All values are produced by the backend, so validation is skipped.
+        """
+        return cls.model_construct(
+            id=f"footage-{sentence_id}-selected",
+            title=f"User-selected footage for sentence {sentence_id}",
+            description="User-selected footage from Pexels",
+            thumbnail="/placeholder.svg",
+            duration=10.0,  # Default duration
+            tags=USER_SELECTED_FOOTAGE_TAGS,
+            category="user-selected",
+            mood="neutral",
+            relevance_score=100,  # User selected is always most relevant
+            url=url,
+        )
+
 
 # Project Schemas
 class ProjectBase(BaseModel):
@@ -37,8 +92,9 @@ class ProjectBase(BaseModel):
 class ProjectCreate(ProjectBase):
     """Schema for creating a project."""
 
-    id: str = Field(default_factory=lambda: generate_id("proj"))
+    id: str = Field(default_factory=partial(generate_id, "proj"))
     audio_file_path: str
+    total_duration: float | None = None
 
 
 class ProjectUpdate(BaseModel):
@@ -79,7 +135,7 @@ class SentenceBase(BaseModel):
 class SentenceCreate(SentenceBase):
     """Schema for creating a sentence."""
 
-    id: str | None = Field(default_factory=lambda: generate_id("sent"))
+    id: str | None = Field(default_factory=partial(generate_id, "sent"))
     selected_footage: SelectedFootage | None = None
 
 
@@ -114,7 +170,7 @@ class FootageChoiceBase(BaseModel):
 class FootageChoiceCreate(FootageChoiceBase):
     """Schema for creating footage choices."""
 
-    id: str | None = Field(default_factory=lambda: generate_id("foot"))
+    id: str | None = Field(default_factory=partial(generate_id, "foot"))
     footage_options: list[dict[str, Any]]
 
 
@@ -145,7 +201,7 @@ class MusicRecommendationBase(BaseModel):
 class MusicRecommendationCreate(MusicRecommendationBase):
     """Schema for creating music recommendations."""
 
-    id: str | None = Field(default_factory=lambda: generate_id("music"))
+    id: str | None = Field(default_factory=partial(generate_id, "music"))
 
 
 class MusicRecommendationResponse(MusicRecommendationBase):
@@ -162,7 +218,7 @@ class MusicRecommendationResponse(MusicRecommendationBase):
 class Sentence(BaseModel):
     """Legacy sentence schema for backward compatibility."""
 
-    sentence_id: str = Field(default_factory=lambda: generate_id("sent"))
+    sentence_id: str = Field(default_factory=partial(generate_id, "sent"))
     text: str
     translated_text: str | None = None
     start: float
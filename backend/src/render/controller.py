@@ -1,13 +1,32 @@
+import hashlib
 from typing import Any
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from base.cache import cache_get_json, cache_set_json
+from base.config import get_settings
 from base.controller import BaseController
 from render.models import RenderTask
 from render.repository import RenderTaskRepository
 from render.schemas import RenderRequest, RenderTaskCreate
 
+settings = get_settings()
+
+
+def render_status_cache_key(task_id: str) -> str:
+    """Build the cache key for a render task's status."""
+    return f"render:status:{task_id}"
+
+
+def render_status_etag(status_info: dict[str, Any]) -> str:
+    """Build a quoted ETag that changes whenever the reported status changes."""
+    fingerprint = "|".join(
+        str(status_info.get(field))
+        for field in ("status", "progress", "video_url", "error")
+    )
+    return f'"{hashlib.sha1(fingerprint.encode()).hexdigest()}"'
+
 
 class RenderController(BaseController[RenderTaskRepository]):
     """Controller for render task business logic."""
@@ -31,15 +50,15 @@ class RenderController(BaseController[RenderTaskRepository]):
     async def get_render_status(
         self, session: AsyncSession, task_id: str
     ) -> dict[str, Any]:
-        """Get render task status."""
-        task = await self.get_entity(session, task_id)
+        """Get render task status, served from the cache while it is fresh."""
+        cached = await cache_get_json(render_status_cache_key(task_id))
+        if cached is not None:
+            return cached
 
-        return {
-            "status": task.status,
-            "progress": task.progress,
-            "video_url": task.output_file_path,
-            "error": task.error_message,
-        }
+        task = await self.get_entity(session, task_id)
+        status_info = self._status_to_dict(task)
+        await self._cache_status(task_id, status_info)
+        return status_info
 
     async def update_render_status(
         self,
@@ -50,8 +69,14 @@ class RenderController(BaseController[RenderTaskRepository]):
         video_url: str | None = None,
         error_message: str | None = None,
     ) -> RenderTask | None:
-        """Update render task status."""
-        return await self.repository.update_status(
+        """Update render task status.
+
+        Progress is clamped to 0-100 rather than rejected, so a rounding
+        overshoot from the renderer never fails a render.
+        """
+        if progress is not None:
+            progress = max(0, min(100, progress))
+        task = await self.repository.update_status(
             session=session,
             task_id=task_id,
             status=status,
@@ -60,6 +85,11 @@ class RenderController(BaseController[RenderTaskRepository]):
             error_message=error_message,
         )
 
+        # Refresh the cached status so pollers see transitions immediately
+        if task:
+            await self._cache_status(task_id, self._status_to_dict(task))
+        return task
+
     async def get_project_render_tasks(
         self, session: AsyncSession, project_id: str
     ) -> dict[str, Any]:
@@ -86,11 +116,30 @@ class RenderController(BaseController[RenderTaskRepository]):
         self, session: AsyncSession, project_id: str
     ) -> str | None:
         """Get the latest completed render video URL for a project."""
-        completed_tasks = await self.repository.get_completed_by_project_id(
+        latest_task = await self.repository.get_latest_completed_by_project_id(
             session, project_id
         )
 
-        if completed_tasks:
-            return completed_tasks[0].output_file_path
+        if latest_task:
+            return latest_task.output_file_path
 
         return None
+
+    @staticmethod
+    def _status_to_dict(task: RenderTask) -> dict[str, Any]:
+        """Convert a render task into its status payload."""
+        return {
+            "status": task.status,
+            "progress": task.progress,
+            "video_url": task.output_file_path,
+            "error": task.error_message,
+        }
+
+    @staticmethod
+    async def _cache_status(task_id: str, status_info: dict[str, Any]) -> None:
+        """Store a render task's status payload in the cache."""
+        await cache_set_json(
+            render_status_cache_key(task_id),
+            status_info,
+            ttl=settings.render_status_cache_ttl,
+        )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Text, func
+from sqlalchemy import DateTime, Index, Text, func
 from sqlmodel import Column, Field, SQLModel
 
 
@@ -8,6 +8,15 @@ class RenderTask(SQLModel, table=True):
     """Render task model representing video rendering operations."""
 
     __tablename__: str = "render_tasks"
+    __table_args__ = (
+        # Serves "latest task with a given status for a project" lookups
+        Index(
+            "ix_render_tasks_project_status_created",
+            "project_id",
+            "status",
+            "created_at",
+        ),
+    )
 
     id: str = Field(primary_key=True, max_length=50, index=True)
     project_id: str = Field(..., max_length=50, foreign_key="projects.id", index=True)
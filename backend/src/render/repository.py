@@ -29,9 +29,10 @@ class RenderTaskRepository(BaseRepository[RenderTask]):
             select(self.model)
             .where(self.model.project_id == project_id)  # type: ignore
             .order_by(self.model.created_at.desc())  # type: ignore
+            .limit(1)
         )
         result = await session.execute(statement)
-        return result.scalar_one_or_none()
+        return result.scalars().first()
 
     async def get_completed_by_project_id(
         self, session: AsyncSession, project_id: str
@@ -46,6 +47,20 @@ class RenderTaskRepository(BaseRepository[RenderTask]):
         result = await session.execute(statement)
         return list(result.scalars().all())
 
+    async def get_latest_completed_by_project_id(
+        self, session: AsyncSession, project_id: str
+    ) -> RenderTask | None:
+        """Get the most recent completed render task for a specific project."""
+        statement = (
+            select(self.model)
+            .where(self.model.project_id == project_id)  # type: ignore
+            .where(self.model.status == "complete")  # type: ignore
+            .order_by(self.model.created_at.desc())  # type: ignore
+            .limit(1)
+        )
+        result = await session.execute(statement)
+        return result.scalars().first()
+
     async def update_status(
         self,
         session: AsyncSession,
@@ -55,19 +70,13 @@ class RenderTaskRepository(BaseRepository[RenderTask]):
         output_file_path: str | None = None,
         error_message: str | None = None,
     ) -> RenderTask | None:
-        """Update render task status and related fields."""
-        task = await self.get(session, task_id)
-        if not task:
-            return None
-
-        task.status = status
+        """Update render task status and related fields in a single statement."""
+        values: dict[str, Any] = {"status": status}
         if progress is not None:
-            task.progress = progress
+            values["progress"] = progress
         if output_file_path:
-            task.output_file_path = output_file_path
+            values["output_file_path"] = output_file_path
         if error_message:
-            task.error_message = error_message
+            values["error_message"] = error_message
 
-        await session.commit()
-        await session.refresh(task)
-        return task
+        return await self._update_returning(session, task_id, values)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import partial
 
 from pydantic import BaseModel, Field
 
@@ -16,7 +17,7 @@ class RenderTaskBase(BaseModel):
 class RenderTaskCreate(RenderTaskBase):
     """Schema for creating a render task."""
 
-    id: str = Field(default_factory=lambda: generate_id("task"))
+    id: str = Field(default_factory=partial(generate_id, "task"))
     project_id: str
     output_file_path: str | None = None
     error_message: str | None = None
@@ -0,0 +1,269 @@
+"""
+Celery tasks for rendering project videos outside of the API process.
+"""
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import aiofiles.os
+
+from base.cache import close_cache
+from base.celery_app import celery_app
+from base.config import get_settings
+from base.http_client import close_http_client
+from database.session import async_session_factory, close_db
+from projects.controller import ProjectController
+from render.controller import RenderController
+from video_processing.lambda_client import render_video_via_lambda
+from video_processing.services import find_background_music
+from video_processing.video_editor import render_project_video
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+controller = RenderController()
+project_controller = ProjectController()
+
+# Minimum seconds between progress writes during a local render
+PROGRESS_WRITE_INTERVAL = 1.0
+
+
+@celery_app.task(name="render.run_render")
+def run_render(task_id: str, add_subtitles: bool = True) -> None:
+    """Render the video for a render task.
+
+    Only the render task ID and the render options travel through the
+    broker; everything else is loaded from the database by the worker.
+    """
+    asyncio.run(_run_render(task_id, add_subtitles))
+
+
+async def _run_render(task_id: str, add_subtitles: bool = True) -> None:
+    """Run the render pipeline on a fresh event loop."""
+    try:
+        await process_render(task_id, add_subtitles)
+    finally:
+        # Pooled connections are bound to the event loop that created them
+        await close_db()
+        await close_cache()
+        await close_http_client()
+
+
+def _put_latest(queue: asyncio.Queue, item: Any) -> None:
+    """Put an item on a bounded queue, replacing a value not yet consumed."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+async def _write_progress(
+    queue: asyncio.Queue[int | None],
+    write: Callable[[int], Awaitable[None]],
+    interval: float = PROGRESS_WRITE_INTERVAL,
+) -> None:
+    """Write the latest queued progress at most once per interval until None.
+
+    A failed write is logged and skipped; progress is informational, so one
+    bad tick must not stop later updates or fail the render.
+    """
+    last_progress = None
+    while (progress := await queue.get()) is not None:
+        if progress != last_progress:
+            try:
+                await write(progress)
+                last_progress = progress
+            except Exception as e:
+                logger.warning(f"Could not write render progress {progress}: {str(e)}")
+        await asyncio.sleep(interval)
+
+
+async def process_render(task_id: str, add_subtitles: bool = True) -> None:
+    """Render a project video and keep the render task status up to date."""
+    async with async_session_factory() as bg_session:
+        try:
+            # Load the render task and the project it belongs to
+            render_task = await controller.get_entity(bg_session, task_id)
+            project_id = render_task.project_id
+            project_details = await project_controller.get_project_with_details(
+                bg_session, project_id
+            )
+
+            # Update status to processing
+            await controller.update_render_status(
+                bg_session, task_id, "processing", progress=10
+            )
+
+            # Get audio file path from project
+            audio_file_path = project_details["audio_file_path"]
+            if not audio_file_path or not await aiofiles.os.path.exists(
+                audio_file_path
+            ):
+                await controller.update_render_status(
+                    bg_session,
+                    task_id,
+                    "failed",
+                    error_message="Audio file not found",
+                )
+                return
+
+            # Update progress
+            await controller.update_render_status(
+                bg_session, task_id, "processing", progress=25
+            )
+
+            # Find background music if not provided
+            music_file_path = None
+            music_recommendations = project_details.get("music_recommendations", [])
+
+            if music_recommendations:
+                # Use the first music recommendation
+                music_file_path = music_recommendations[0].get("url")
+            else:
+                # Find music from local directory
+                music_tracks = await find_background_music()
+                if music_tracks:
+                    music_file_path = music_tracks[0]["url"]
+
+            # Update progress
+            await controller.update_render_status(
+                bg_session, task_id, "processing", progress=40
+            )
+
+            # Render the video - use Lambda if enabled
+            if settings.use_lambda_rendering:
+                # Lambda rendering - requires publicly accessible URLs
+                # Upload audio file to S3 and get presigned URL
+                from video_processing.s3_client import get_presigned_url_for_file
+
+                try:
+                    logger.info("Uploading audio file to S3...")
+                    # Generate unique S3 key for the audio file
+                    audio_s3_key = f"audio/{project_id}/{Path(audio_file_path).name}"
+                    audio_s3_key_result, audio_url = await get_presigned_url_for_file(
+                        audio_file_path,
+                        s3_key=audio_s3_key,
+                        expiration=7200,  # 2 hours to allow for rendering
+                    )
+                    logger.info(f"Audio file uploaded to S3: {audio_s3_key_result}")
+
+                    # Upload music file to S3 if it's a local file
+                    music_url = None
+                    if music_file_path:
+                        # Check if it's a relative API path (starts with /api/)
+                        if music_file_path.startswith('/api/audio/'):
+                            # Convert relative API path to absolute local file path
+                            # /api/audio/file.mp3 -> /path/to/backend/static/audio/file.mp3
+                            filename = music_file_path.replace('/api/audio/', '')
+                            music_file_path = str(settings.audio_dir / filename)
+                            logger.info(f"Converted relative music path to: {music_file_path}")
+
+                        if await aiofiles.os.path.exists(music_file_path):
+                            logger.info(f"Uploading music file to S3: {music_file_path}")
+                            music_s3_key = f"music/{project_id}/{Path(music_file_path).name}"
+                            music_s3_key_result, music_url = await get_presigned_url_for_file(
+                                music_file_path,
+                                s3_key=music_s3_key,
+                                expiration=7200,
+                            )
+                            logger.info(f"Music file uploaded to S3: {music_s3_key_result}")
+                        elif music_file_path.startswith('http'):
+                            # If music_file_path is already a URL, use it directly
+                            music_url = music_file_path
+                            logger.info(f"Using music URL directly: {music_url}")
+                        else:
+                            logger.warning(f"Music file not found at {music_file_path}, skipping background music")
+
+                    logger.info("Starting Lambda video rendering...")
+                    result = await render_video_via_lambda(
+                        project_data=project_details,
+                        audio_url=audio_url,
+                        music_url=music_url,
+                    )
+
+                    # Get video URL from Lambda result
+                    video_url = result.get("video_url")
+
+                    logger.info(f"Lambda rendering complete: {video_url}")
+
+                    # Update status to complete
+                    await controller.update_render_status(
+                        bg_session,
+                        task_id,
+                        "complete",
+                        progress=100,
+                        video_url=video_url,
+                    )
+
+                    # Update project with video URL
+                    await project_controller.update_entity(
+                        bg_session, project_id, {"video_url": video_url}
+                    )
+                except Exception as lambda_error:
+                    logger.error(f"Lambda rendering failed: {str(lambda_error)}")
+                    raise
+            else:
+                # Local rendering (original method)
+                # Report encoding progress between 40% and 95%. The writer task
+                # saves the latest value so FFmpeg output is never read behind
+                # a database write.
+                progress_queue: asyncio.Queue[int | None] = asyncio.Queue(maxsize=1)
+
+                async def write_progress(progress: int) -> None:
+                    try:
+                        await controller.update_render_status(
+                            bg_session, task_id, "processing", progress=progress
+                        )
+                    except Exception:
+                        # Keep the session usable for the next status write
+                        await bg_session.rollback()
+                        raise
+
+                async def report_progress(fraction: float) -> None:
+                    _put_latest(progress_queue, 40 + int(fraction * 55))
+
+                writer = asyncio.create_task(
+                    _write_progress(
+                        progress_queue, write_progress, PROGRESS_WRITE_INTERVAL
+                    )
+                )
+                output_filename = f"{project_id}_final_video.mp4"
+                try:
+                    output_path = await render_project_video(
+                        project_data=project_details,
+                        audio_file_path=audio_file_path,
+                        music_file_path=music_file_path,
+                        output_filename=output_filename,
+                        progress_callback=report_progress,
+                        add_subtitles=add_subtitles,
+                    )
+                finally:
+                    # Let the writer finish its current write before the
+                    # session is used for the final status
+                    _put_latest(progress_queue, None)
+                    await writer
+
+                # Extract the actual filename from the returned path
+                actual_filename = os.path.basename(output_path)
+                relative_path = f"/api/videos/{actual_filename}"
+
+                # Update status to complete
+                await controller.update_render_status(
+                    bg_session,
+                    task_id,
+                    "complete",
+                    progress=100,
+                    video_url=relative_path,
+                )
+
+                # Update project with video URL
+                await project_controller.update_entity(
+                    bg_session, project_id, {"video_url": relative_path}
+                )
+
+        except Exception as e:
+            logger.error(f"Error in render task {task_id}: {str(e)}")
+            await controller.update_render_status(
+                bg_session, task_id, "failed", error_message=str(e)
+            )
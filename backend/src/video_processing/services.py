@@ -1,75 +1,157 @@
 import asyncio
+import hashlib
+import json
 import logging
-from pathlib import Path
+import re
+from datetime import UTC, datetime
 from typing import Any
 
-import httpx
+import aiofiles
+import aiofiles.os
 
+from base.cache import cache_delete, cache_get_json, cache_set_json
 from base.config import get_settings
+from base.http_client import get_http_client
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Whisper model used for transcription (part of the transcription cache key)
+TRANSCRIPTION_MODEL = "whisper-large-v3"
+
+# Whisper language values for which translation to English is skipped
+ENGLISH_LANGUAGES = frozenset(("en", "english"))
+
+# Footage used when Pexels returns no usable result
+DEFAULT_FOOTAGE_URL = "https://www.pexels.com/video/waves-crashing-on-beach-1409899/"
+
+# Words ignored when building footage search queries
+_COMMON_WORDS = frozenset(
+    (
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "is",
+        "are",
+        "was",
+        "were",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+    )
+)
+_KEYWORD_TOKEN_RE = re.compile(r"[a-z]+")
+
+# (audio directory mtime, music recommendations) from the last directory scan
+_music_cache: tuple[float, list[dict[str, Any]]] | None = None
+
+
+async def transcribe_audio(
+    audio_path: str, audio_hash: str | None = None
+) -> list[dict[str, Any]]:
+    """Transcribe audio file using Groq API (Whisper model) and return sentences with timestamps.
 
-async def transcribe_audio(audio_path: str) -> list[dict[str, Any]]:
-    """Transcribe audio file using Groq API (Whisper model) and return sentences with timestamps."""
+    Results are cached by the SHA-256 of the audio content, so identical audio
+    is only sent to Groq once. Pass ``audio_hash`` when it is already known
+    (e.g. computed while saving the upload) to skip reading the file on a
+    cache hit.
+    """
     try:
+        audio_bytes = None
+        if audio_hash is None:
+            audio_bytes = await _read_audio(audio_path)
+            audio_hash = hashlib.sha256(audio_bytes).hexdigest()
+
+        cache_key = _transcription_cache_key(audio_hash)
+        cached = await cache_get_json(cache_key)
+        if cached and cached.get("sentences"):
+            logger.info(f"Transcription cache hit for audio {audio_hash}")
+            return cached["sentences"]
+
+        if audio_bytes is None:
+            audio_bytes = await _read_audio(audio_path)
+
         headers = {"Authorization": f"Bearer {settings.groq_api_key}"}
+        files = {"file": ("audio.mp3", audio_bytes, "audio/mpeg")}
+
+        data = {"model": TRANSCRIPTION_MODEL, "response_format": "verbose_json"}
+
+        client = get_http_client()
+        response = await client.post(
+            f"{settings.groq_api_url}/audio/transcriptions",
+            headers=headers,
+            data=data,
+            files=files,
+            timeout=60.0,
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Groq API error: {response.text}")
+            return []
+
+        result = response.json()
+
+        # Process sentences with timestamps. Whisper segments start with a
+        # space, so the text is stripped once here for everything downstream.
+        sentences = [
+            {
+                "text": segment["text"].strip(),
+                "start": segment["start"],
+                "end": segment["end"],
+            }
+            for segment in result.get("segments", [])
+        ]
+
+        if sentences:
+            # Whisper reports the detected language; English needs no translation
+            detected_language = str(result.get("language", "")).strip().lower()
+            if detected_language in ENGLISH_LANGUAGES:
+                for sentence in sentences:
+                    sentence["translated_text"] = sentence["text"]
+            else:
+                # Translate all sentences in a single batched request
+                translations = await translate_texts([s["text"] for s in sentences])
+                for sentence, translation in zip(sentences, translations, strict=True):
+                    sentence["translated_text"] = translation
+
+            await cache_set_json(
+                cache_key,
+                {
+                    "sentences": sentences,
+                    "model": TRANSCRIPTION_MODEL,
+                    "cached_at": datetime.now(UTC).isoformat(),
+                },
+                ttl=settings.transcription_cache_ttl,
+            )
 
-        with open(audio_path, "rb") as audio_file:
-            files = {"file": ("audio.mp3", audio_file, "audio/mpeg")}
-
-            data = {"model": "whisper-large-v3", "response_format": "verbose_json"}
-
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{settings.groq_api_url}/audio/transcriptions",
-                    headers=headers,
-                    data=data,
-                    files=files,
-                    timeout=60.0,
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"Groq API error: {response.text}")
-                    return []
-
-                result = response.json()
-
-                # Process sentences with timestamps
-                sentences = []
-                translation_tasks = []
-
-                for segment in result.get("segments", []):
-                    sentence_data = {
-                        "text": segment["text"],
-                        "start": segment["start"],
-                        "end": segment["end"],
-                    }
-                    sentences.append(sentence_data)
-                    translation_tasks.append(translate_text(segment["text"]))
-
-                # Execute translations concurrently
-                if sentences:
-                    translations = await asyncio.gather(
-                        *translation_tasks, return_exceptions=True
-                    )
-
-                    for i, translation in enumerate(translations):
-                        if not isinstance(translation, Exception):
-                            sentences[i]["translated_text"] = translation
-                        else:
-                            sentences[i]["translated_text"] = sentences[i][
-                                "text"
-                            ]  # Fallback to original
-
-                return sentences
+        return sentences
 
     except Exception as e:
         logger.error(f"Error transcribing audio: {str(e)}")
         return []
 
 
+async def invalidate_transcription_cache(audio_hash: str) -> bool:
+    """Remove a cached transcription by audio hash. Returns True if an entry was removed."""
+    return await cache_delete(_transcription_cache_key(audio_hash))
+
+
+async def _read_audio(audio_path: str) -> bytes:
+    """Read an audio file without blocking the event loop."""
+    async with aiofiles.open(audio_path, "rb") as audio_file:
+        return await audio_file.read()
+
+
+def _transcription_cache_key(audio_hash: str) -> str:
+    """Build the cache key for a transcription of the given audio content."""
+    return f"transcription:{TRANSCRIPTION_MODEL}:{audio_hash}"
+
+
 async def translate_text(text: str) -> str:
     """Translate text to English using Groq API for better search results."""
     try:
@@ -96,40 +178,115 @@ async def translate_text(text: str) -> str:
             "max_tokens": 1024,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.groq_api_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=30.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            f"{settings.groq_api_url}/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=30.0,
+        )
 
-            if response.status_code != 200:
-                logger.error(f"Groq API translation error: {response.text}")
-                return text
+        if response.status_code != 200:
+            logger.error(f"Groq API translation error: {response.text}")
+            return text
 
-            result = response.json()
-            translation = (
-                result.get("choices", [{}])[0]
-                .get("message", {})
-                .get("content", "")
-                .strip()
-            )
+        result = response.json()
+        translation = (
+            result.get("choices", [{}])[0]
+            .get("message", {})
+            .get("content", "")
+            .strip()
+        )
 
-            if not translation:
-                logger.warning(f"Empty translation result for: {text}")
-                return text
+        if not translation:
+            logger.warning(f"Empty translation result for: {text}")
+            return text
 
-            logger.info(
-                f"Successfully translated: '{text[:30]}...' → '{translation[:30]}...'"
-            )
-            return translation
+        logger.info(
+            f"Successfully translated: '{text[:30]}...' → '{translation[:30]}...'"
+        )
+        return translation
 
     except Exception as e:
         logger.error(f"Error translating text: {str(e)}")
         return text
 
 
+async def translate_texts(texts: list[str]) -> list[str]:
+    """Translate a batch of texts to English with a single Groq request.
+
+    Falls back to translating each text individually if the batched response
+    cannot be parsed.
+    """
+    if not texts:
+        return []
+
+    try:
+        headers = {
+            "Authorization": f"Bearer {settings.groq_api_key}",
+            "Content-Type": "application/json",
+        }
+
+        prompt = (
+            "Translate each item of the following JSON array to English. "
+            'Respond with a JSON object of the form {"translations": [...]} containing '
+            "the translations as strings, in the same order and with the same number of items:\n\n"
+            f"{json.dumps(texts, ensure_ascii=False)}"
+        )
+
+        data = {
+            "model": "llama-3.3-70b-versatile",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a professional translator. Translate the given texts to English accurately.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.1,
+            "response_format": {"type": "json_object"},
+        }
+
+        client = get_http_client()
+        response = await client.post(
+            f"{settings.groq_api_url}/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=60.0,
+        )
+
+        if response.status_code != 200:
+            raise ValueError(f"Groq API batch translation error: {response.text}")
+
+        result = response.json()
+        content = (
+            result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        )
+        translations = json.loads(content).get("translations")
+
+        if not isinstance(translations, list) or len(translations) != len(texts):
+            raise ValueError("Batch translation returned an unexpected number of items")
+
+        logger.info(f"Successfully translated {len(texts)} texts in one request")
+        return [
+            str(translation).strip() or text
+            for text, translation in zip(texts, translations, strict=True)
+        ]
+
+    except Exception as e:
+        logger.warning(
+            f"Batch translation failed, translating individually: {str(e)}"
+        )
+
+    results = await asyncio.gather(
+        *(translate_text(text) for text in texts), return_exceptions=True
+    )
+    return [
+        text if isinstance(result, Exception) else result
+        for text, result in zip(texts, results, strict=True)
+    ]
+
+
 async def generate_project_title(sentences: list[str]) -> str:
     """Generate a concise project title using Groq based on the content."""
     try:
@@ -163,33 +320,33 @@ Respond with ONLY the title, nothing else."""
             "max_tokens": 50,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.groq_api_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=15.0,
-            )
+        client = get_http_client()
+        response = await client.post(
+            f"{settings.groq_api_url}/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=15.0,
+        )
 
-            if response.status_code != 200:
-                logger.error(f"Groq API title generation error: {response.text}")
-                return "Untitled Project"
-
-            result = response.json()
-            title = (
-                result.get("choices", [{}])[0]
-                .get("message", {})
-                .get("content", "")
-                .strip()
-                .replace('"', '')  # Remove quotes if present
-            )
+        if response.status_code != 200:
+            logger.error(f"Groq API title generation error: {response.text}")
+            return "Untitled Project"
 
-            if not title or len(title) > 100:  # Sanity check
-                logger.warning(f"Invalid title generated: {title}")
-                return "Untitled Project"
+        result = response.json()
+        title = (
+            result.get("choices", [{}])[0]
+            .get("message", {})
+            .get("content", "")
+            .strip()
+            .replace('"', '')  # Remove quotes if present
+        )
+
+        if not title or len(title) > 100:  # Sanity check
+            logger.warning(f"Invalid title generated: {title}")
+            return "Untitled Project"
 
-            logger.info(f"Successfully generated title: '{title}'")
-            return title
+        logger.info(f"Successfully generated title: '{title}'")
+        return title
 
     except Exception as e:
         logger.error(f"Error generating project title: {str(e)}")
@@ -205,120 +362,152 @@ async def find_footage_for_sentence(
         if not translated_text:
             translated_text = await translate_text(text)
 
-        # Extract keywords from the translated sentence
-        keywords = translated_text.lower().split()
-        # Filter out common words
-        common_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "is",
-            "are",
-            "was",
-            "were",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-        }
-        keywords = [word for word in keywords if word not in common_words]
+        # Extract the first few non-common words from the translated sentence
+        keywords = [
+            word
+            for word in _KEYWORD_TOKEN_RE.findall(translated_text.lower())
+            if word not in _COMMON_WORDS
+        ][:3]
 
-        # Use the first few keywords for the search
-        search_query = " ".join(keywords[:3]) if keywords else "general"
+        # Use the keywords for the search
+        search_query = " ".join(keywords) or "general"
 
         logger.info(
             f"Searching footage with query: '{search_query}' (translated from: '{text}')"
         )
 
-        headers = {"Authorization": settings.pexels_api_key}
+        # Serve repeated queries from the cache before hitting Pexels
+        cache_key = f"pexels:{search_query}"
+        cached = await cache_get_json(cache_key)
+        if cached and cached.get("url"):
+            logger.info(f"Footage cache hit for query: '{search_query}'")
+            return cached["url"]
+
+        footage_url = await _search_pexels_video(search_query)
+        if footage_url is None:
+            return DEFAULT_FOOTAGE_URL
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.pexels_api_url}/search?query={search_query}&per_page=1&orientation=landscape",
-                headers=headers,
+        if footage_url:
+            await cache_set_json(
+                cache_key,
+                {
+                    "url": footage_url,
+                    "source": "pexels",
+                    "fetched_at": datetime.now(UTC).isoformat(),
+                },
+                ttl=settings.footage_cache_ttl,
             )
+        return footage_url
+
+    except Exception as e:
+        logger.error(f"Error finding footage: {str(e)}")
+        return ""
 
-            if response.status_code != 200:
-                logger.error(f"Pexels API error: {response.text}")
-                return "https://www.pexels.com/video/waves-crashing-on-beach-1409899/"
 
-            result = response.json()
-            videos = result.get("videos", [])
+async def find_footage_for_sentences(
+    sentences: list[dict[str, Any]],
+) -> list[str]:
+    """Find footage for many sentences concurrently.
 
-            if not videos:
-                return "https://www.pexels.com/video/waves-crashing-on-beach-1409899/"
+    Lookups run in parallel, capped at FOOTAGE_SEARCH_CONCURRENCY in-flight
+    requests to respect Pexels rate limits. Results are in sentence order;
+    failed lookups yield an empty string.
+    """
+    semaphore = asyncio.Semaphore(settings.footage_search_concurrency)
 
-            # Get the video file with the highest quality but reasonable size
-            video_files = sorted(
-                videos[0].get("video_files", []),
-                key=lambda x: (x.get("width", 0) * x.get("height", 0)),
-                reverse=True,
+    async def find_one(sentence: dict[str, Any]) -> str:
+        async with semaphore:
+            return await find_footage_for_sentence(
+                sentence["text"], sentence.get("translated_text")
             )
 
-            if video_files:
-                for file in video_files:
-                    if file.get("width", 0) <= 1920:  # Limit to Full HD
-                        return file.get("link", "")
+    results = await asyncio.gather(
+        *(find_one(sentence) for sentence in sentences), return_exceptions=True
+    )
+    return ["" if isinstance(result, Exception) else result for result in results]
 
-            # Fallback
-            return videos[0].get("video_files", [{}])[0].get("link", "")
 
-    except Exception as e:
-        logger.error(f"Error finding footage: {str(e)}")
-        return ""
+async def _search_pexels_video(search_query: str) -> str | None:
+    """Search Pexels for a video and return its best file link, or None if nothing was found."""
+    headers = {"Authorization": settings.pexels_api_key}
+
+    client = get_http_client()
+    response = await client.get(
+        f"{settings.pexels_api_url}/search",
+        params={"query": search_query, "per_page": 1, "orientation": "landscape"},
+        headers=headers,
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Pexels API error: {response.text}")
+        return None
+
+    result = response.json()
+    videos = result.get("videos", [])
+
+    if not videos:
+        return None
+
+    # Get the video file with the highest quality but reasonable size
+    # (Full HD at most), falling back to the largest file overall
+    best_file = None
+    best_pixels = -1
+    largest_file = None
+    largest_pixels = -1
+    for file in videos[0].get("video_files", []):
+        pixels = file.get("width", 0) * file.get("height", 0)
+        if pixels > largest_pixels:
+            largest_file, largest_pixels = file, pixels
+        if file.get("width", 0) <= 1920 and pixels > best_pixels:
+            best_file, best_pixels = file, pixels
+
+    chosen_file = best_file or largest_file
+    return chosen_file.get("link", "") if chosen_file else ""
 
 
 async def find_background_music(
     sentence_texts: list[str] | None = None,
 ) -> list[dict[str, Any]]:
-    """Find background music from the local audio directory."""
-    try:
-        # Get all available music files from the audio directory
-        music_files = list(settings.audio_dir.glob("*.mp3"))
+    """Find background music from the local audio directory.
 
-        if not music_files:
-            logger.warning("No music files found in audio directory")
-            return []
-
-        # Create music recommendations from available files
-        music_recommendations = []
-        for i, music_file in enumerate(music_files):
-            music_id = f"music-{i + 1}"
-            name = music_file.stem  # Use filename without extension as the name
+    The directory listing is cached and only rescanned when the directory's
+    modification time changes (i.e. files were added, removed or renamed).
+    """
+    global _music_cache
 
-            # Create URL that can be served by the static files endpoint
-            relative_path = music_file.relative_to(settings.audio_dir)
-            audio_url = f"/api/audio/{relative_path}"
-
-            music_recommendations.append(
-                {"id": music_id, "name": name, "url": audio_url}
-            )
+    try:
+        mtime = (await aiofiles.os.stat(settings.audio_dir)).st_mtime
+        if _music_cache is None or _music_cache[0] != mtime:
+            _music_cache = (mtime, await asyncio.to_thread(_scan_music_directory))
 
-            logger.info(f"Added music file: {name} at {music_file}")
+        music_recommendations = _music_cache[1]
+        if not music_recommendations:
+            logger.warning("No music files found in audio directory")
 
-        return music_recommendations
+        return list(music_recommendations)
     except Exception as e:
         logger.error(f"Error finding background music: {str(e)}")
         return []
 
 
-async def download_file(url: str, destination: Path) -> bool:
-    """Download a file from URL to destination path."""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=60.0)
-            response.raise_for_status()
+def _scan_music_directory() -> list[dict[str, Any]]:
+    """Build music recommendations from the files in the audio directory."""
+    # Get all available music files from the audio directory
+    music_files = list(settings.audio_dir.glob("*.mp3"))
 
-            with open(destination, "wb") as f:
-                f.write(response.content)
+    # Create music recommendations from available files
+    music_recommendations = []
+    for i, music_file in enumerate(music_files):
+        music_id = f"music-{i + 1}"
+        name = music_file.stem  # Use filename without extension as the name
 
-            logger.info(f"Successfully downloaded file to {destination}")
-            return True
+        # Create URL that can be served by the static files endpoint
+        relative_path = music_file.relative_to(settings.audio_dir)
+        audio_url = f"/api/audio/{relative_path}"
+
+        music_recommendations.append({"id": music_id, "name": name, "url": audio_url})
+
+        logger.info(f"Added music file: {name} at {music_file}")
+
+    return music_recommendations
 
-    except Exception as e:
-        logger.error(f"Error downloading file from {url}: {str(e)}")
-        return False
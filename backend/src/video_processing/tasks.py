@@ -0,0 +1,43 @@
+"""
+Celery tasks for housekeeping of video processing files.
+"""
+import logging
+import shutil
+import time
+
+from base.celery_app import celery_app
+from base.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Files written to the temp directory: partial uploads, downloaded footage
+# and scratch directories left behind by interrupted renders
+TEMP_FILE_PATTERNS = ("*.part", "footage_*", "render_*")
+
+
+@celery_app.task(name="video_processing.cleanup_temp_files")
+def cleanup_temp_files() -> int:
+    """Delete temp files older than TEMP_FILE_MAX_AGE. Returns the number removed."""
+    cutoff = time.time() - settings.temp_file_max_age
+    removed = 0
+
+    # Render scratch directories may live on tmpfs rather than in TEMP_DIR
+    temp_dirs = {settings.temp_dir, settings.render_scratch_dir}
+
+    for temp_dir in temp_dirs:
+        for pattern in TEMP_FILE_PATTERNS:
+            for path in temp_dir.glob(pattern):
+                try:
+                    if path.stat().st_mtime >= cutoff:
+                        continue
+                    if path.is_dir():
+                        shutil.rmtree(path)
+                    else:
+                        path.unlink(missing_ok=True)
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove temp file {path}: {str(e)}")
+
+    logger.info(f"Removed {removed} stale temp files")
+    return removed
@@ -1,91 +1,207 @@
 import asyncio
+import json
 import logging
 import os
+import shutil
+import tempfile
+import textwrap
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
+import aiofiles
+import aiofiles.os
 import httpx
 
 from base.config import get_settings
+from base.http_client import get_http_client
 
-# Import MoviePy components
-if TYPE_CHECKING:
-    from moviepy import (
-        AudioFileClip,
-        CompositeAudioClip,
-        CompositeVideoClip,
-        TextClip,
-        VideoFileClip,
-        concatenate_audioclips,
-        concatenate_videoclips,
-    )
-else:
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Output video format
+OUTPUT_WIDTH = 1920
+OUTPUT_HEIGHT = 1080
+OUTPUT_FPS = 24
+
+# Background music is mixed in quieter than the voice-over
+MUSIC_VOLUME = 0.3
+
+# Subtitles are wrapped to stay within ~1800px at this font size
+SUBTITLE_FONT_SIZE = 50
+SUBTITLE_WRAP_WIDTH = 60
+
+# Size of each chunk written to disk while downloading footage
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # 64KB
+
+# Transient download failures are retried with exponential backoff
+DOWNLOAD_ATTEMPTS = 3
+DOWNLOAD_BACKOFF_BASE = 0.5  # seconds
+DOWNLOAD_BACKOFF_MAX = 8.0  # seconds
+
+# Receives the render progress as a fraction between 0 and 1
+ProgressCallback = Callable[[float], Awaitable[None]]
+
+# Encoder settings per supported H.264 encoder
+ENCODER_ARGS = {
+    "h264_nvenc": [
+        "-c:v", "h264_nvenc",
+        "-preset", "p4",
+        "-rc", "vbr",
+        "-cq", "23",
+        "-b:v", "8M",
+        "-maxrate", "12M",
+    ],
+    "libx264": [
+        "-c:v", "libx264",
+        "-preset", "ultrafast",
+        "-threads", str(settings.render_encoder_threads),
+    ],
+}
+
+# Encoder picked for this process, detected on first use
+_video_encoder: str | None = None
+
+
+async def download_video_file(url: str, destination: Path) -> bool:
+    """Download a video file from URL to destination path."""
+    partial_path = destination.with_name(f"{destination.name}.part")
     try:
-        # MoviePy 2.x uses direct imports from moviepy package
-        from moviepy import (
-            AudioFileClip,
-            CompositeAudioClip,
-            CompositeVideoClip,
-            TextClip,
-            VideoFileClip,
-            concatenate_audioclips,
-            concatenate_videoclips,
-        )
+        logger.info(f"Downloading video from {url} to {destination}")
 
-        MOVIEPY_AVAILABLE = True
-    except ImportError:
-        # Define placeholder classes for runtime when MoviePy is not available
-        class VideoFileClip:  # type: ignore
-            pass
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+            try:
+                await _stream_to_file(url, partial_path)
+                break
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                if attempt == DOWNLOAD_ATTEMPTS or not _is_retryable(e):
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    f"Download of {url} failed ({str(e)}), retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
 
-        class AudioFileClip:  # type: ignore
-            pass
+        await aiofiles.os.replace(partial_path, destination)
 
-        class TextClip:  # type: ignore
-            pass
+        logger.info(f"Successfully downloaded video to {destination}")
+        return True
 
-        class CompositeVideoClip:  # type: ignore
-            pass
+    except Exception as e:
+        logger.error(f"Error downloading video from {url}: {str(e)}")
+        if await aiofiles.os.path.exists(partial_path):
+            await aiofiles.os.remove(partial_path)
+        return False
 
-        class CompositeAudioClip:  # type: ignore
-            pass
 
-        def concatenate_videoclips(*args, **kwargs):  # type: ignore
-            pass
+async def _stream_to_file(url: str, path: Path) -> None:
+    """Stream a URL into a file chunk by chunk."""
+    # Stream into a partial file so an interrupted download is never
+    # mistaken for cached footage
+    client = get_http_client()
+    async with client.stream("GET", url, follow_redirects=True, timeout=60.0) as response:
+        response.raise_for_status()
 
-        def concatenate_audioclips(*args, **kwargs):  # type: ignore
-            pass
+        async with aiofiles.open(path, "wb") as f:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                await f.write(chunk)
 
-        MOVIEPY_AVAILABLE = False
-        logging.warning("MoviePy not available. Video rendering will be disabled.")
 
-logger = logging.getLogger(__name__)
-settings = get_settings()
+def _is_retryable(error: httpx.HTTPError) -> bool:
+    """Check whether a download error is worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return True
 
 
-async def download_video_file(url: str, destination: Path) -> bool:
-    """Download a video file from URL to destination path."""
+def _retry_delay(error: httpx.HTTPError, attempt: int) -> float:
+    """Get the backoff before the next attempt, honoring Retry-After on 429s."""
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+        retry_after = error.response.headers.get("retry-after", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), DOWNLOAD_BACKOFF_MAX)
+    return min(DOWNLOAD_BACKOFF_BASE * 2 ** (attempt - 1), DOWNLOAD_BACKOFF_MAX)
+
+
+async def _ffmpeg_succeeds(*args: str) -> tuple[bool, str]:
+    """Run a short FFmpeg command and return whether it succeeded and its stdout."""
     try:
-        logger.info(f"Downloading video from {url} to {destination}")
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-hide_banner", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+    except OSError:
+        return False, ""
+    return process.returncode == 0, stdout.decode(errors="replace")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True, timeout=60.0)
-            response.raise_for_status()
 
-            with open(destination, "wb") as f:
-                f.write(response.content)
+async def probe_video(path: str) -> dict[str, Any] | None:
+    """Probe the format and duration of a file's first video stream with ffprobe."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries",
+            "stream=codec_name,width,height,pix_fmt,avg_frame_rate:format=duration",
+            "-of", "json",
+            path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+    except OSError:
+        return None
 
-            logger.info(f"Successfully downloaded video to {destination}")
-            return True
+    if process.returncode != 0:
+        return None
 
-    except Exception as e:
-        logger.error(f"Error downloading video from {url}: {str(e)}")
-        return False
+    try:
+        result = json.loads(stdout)
+        stream = result["streams"][0]
+        duration = float(result["format"]["duration"])
+    except (ValueError, KeyError, IndexError):
+        return None
+    return {**stream, "duration": duration}
+
+
+async def get_video_encoder() -> str:
+    """Get the H.264 encoder to render with.
+
+    With VIDEO_ENCODER=auto, NVENC is used when FFmpeg lists it and a short
+    test encode succeeds (the encoder can be compiled in without a usable
+    GPU); otherwise libx264 is used. The result is cached per process.
+    """
+    global _video_encoder
+
+    if _video_encoder is None:
+        if settings.video_encoder != "auto":
+            _video_encoder = settings.video_encoder
+        else:
+            _video_encoder = "libx264"
+            _, encoders = await _ffmpeg_succeeds("-encoders")
+            if "h264_nvenc" in encoders:
+                works, _ = await _ffmpeg_succeeds(
+                    "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                    "-c:v", "h264_nvenc", "-f", "null", "-",
+                )
+                if works:
+                    _video_encoder = "h264_nvenc"
+        logger.info(f"Rendering videos with the {_video_encoder} encoder")
+
+    return _video_encoder
 
 
 class VideoEditor:
-    """Video editor for creating final rendered videos from project data."""
+    """Video editor for creating final rendered videos from project data.
+
+    The whole timeline is rendered by a single FFmpeg invocation: every
+    footage file is an input, and trimming, scaling, subtitles, concatenation
+    and audio mixing all happen inside one filter graph.
+    """
 
     def __init__(
         self, temp_dir: Path | None = None, output_dir: Path | None = None
@@ -97,16 +213,26 @@ class VideoEditor:
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Scratch files go to tmpfs when possible, otherwise next to the footage
+        self.scratch_dir = settings.render_scratch_dir if temp_dir is None else temp_dir
+        try:
+            self.scratch_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Cannot use scratch dir {self.scratch_dir}: {str(e)}")
+            self.scratch_dir = self.temp_dir
+
     async def render_project_video(
         self,
         project_data: dict[str, Any],
         audio_file_path: str,
         music_file_path: str | None = None,
         output_filename: str | None = None,
+        progress_callback: ProgressCallback | None = None,
+        add_subtitles: bool = True,
     ) -> str:
         """Render a complete video from project data."""
-        if not MOVIEPY_AVAILABLE:
-            raise RuntimeError("MoviePy is not available. Cannot render video.")
+        if not shutil.which("ffmpeg"):
+            raise RuntimeError("FFmpeg is not available. Cannot render video.")
 
         project_id = project_data["id"]
         if not output_filename:
@@ -122,71 +248,54 @@ class VideoEditor:
 
         output_path = self.output_dir / timestamped_filename
 
+        # Per-render scratch directory for subtitle files and the concat list
+        work_dir = self._make_work_dir(f"render_{project_id}_")
+
         try:
-            # Step 1: Download all footage
+            # Step 1: Download and probe all footage
             logger.info("Downloading footage files...")
             await self._download_footage(project_data["sentences"])
 
-            # Step 2: Create video clips with subtitles
-            logger.info("Creating video clips...")
-            video_clips = self._create_video_clips(project_data["sentences"])
-
-            if not video_clips:
-                raise ValueError("No video clips were created")
+            # Drop missing voice-over and music once, so the command builders
+            # below never touch the filesystem
+            voice_path = (
+                audio_file_path
+                if await aiofiles.os.path.exists(audio_file_path)
+                else None
+            )
+            music_path = (
+                music_file_path
+                if music_file_path and await aiofiles.os.path.exists(music_file_path)
+                else None
+            )
 
-            # Step 3: Combine video clips
-            logger.info("Combining video clips...")
-            final_video = concatenate_videoclips(video_clips, method="compose")
-
-            # Step 4: Add audio (voice-over)
-            logger.info("Adding voice-over audio...")
-            if os.path.exists(audio_file_path):
-                voice_audio = AudioFileClip(audio_file_path)
-                final_video = final_video.with_audio(voice_audio)  # type: ignore
-
-            # Step 5: Add background music if provided
-            if music_file_path and os.path.exists(music_file_path):
-                logger.info("Adding background music...")
-                music_audio = AudioFileClip(music_file_path)
-
-                # Adjust music volume to be quieter than voice
-                music_audio_scaled = music_audio.with_volume_scaled(0.3)  # type: ignore
-                
-                if music_audio_scaled:
-                    music_audio = music_audio_scaled
-                else:
-                    logger.warning("Failed to scale music volume, using original")
-
-                # Loop music to match video duration if needed
-                if music_audio.duration < final_video.duration:  # type: ignore
-                    # Loop music by repeating it
-                    times_to_loop = int(final_video.duration / music_audio.duration) + 1  # type: ignore
-                    music_audio = concatenate_audioclips([music_audio] * times_to_loop).subclipped(0, final_video.duration)  # type: ignore
-                else:
-                    music_audio = music_audio.subclipped(0, final_video.duration)  # type: ignore
-
-                # Combine voice and music
-                if final_video.audio:  # type: ignore
-                    composite_audio = CompositeAudioClip(
-                        [final_video.audio, music_audio]  # type: ignore
-                    )
-                    final_video = final_video.with_audio(composite_audio)  # type: ignore
-                else:
-                    final_video = final_video.with_audio(music_audio)  # type: ignore
-
-            # Step 6: Export final video
-            logger.info(f"Exporting final video to {output_path}...")
-            final_video.write_videofile(
-                str(output_path),
-                fps=24,
-                codec="libx264",
-                audio_codec="aac",
-                temp_audiofile="temp-audio.m4a",
-                remove_temp=True,
+            # Step 2: Work out the segment for each sentence
+            logger.info("Preparing video segments...")
+            segments = await self._prepare_segments(
+                project_data["sentences"], work_dir, add_subtitles
             )
 
-            # Clean up
-            final_video.close()
+            if not segments:
+                raise ValueError("No video clips were created")
+
+            # Step 3: Render the timeline, voice-over and music in one pass
+            logger.info(f"Rendering final video to {output_path}...")
+            if self._can_stream_copy(segments, music_path):
+                # Footage can be joined as-is, so skip decoding and encoding
+                logger.info("All footage matches, joining it without re-encoding")
+                concat_list_path = work_dir / "concat.txt"
+                async with aiofiles.open(concat_list_path, "w", encoding="utf-8") as f:
+                    await f.write(self._concat_list(segments))
+                args = self._build_copy_args(
+                    concat_list_path, segments, voice_path, output_path
+                )
+            else:
+                encoder = await get_video_encoder()
+                args = self._build_ffmpeg_args(
+                    segments, voice_path, music_path, output_path, encoder
+                )
+            total_duration = sum(segment["duration"] for segment in segments)
+            await self._run_ffmpeg(args, total_duration, progress_callback)
 
             logger.info(f"Video rendering completed: {output_path}")
             return str(output_path)
@@ -195,9 +304,43 @@ class VideoEditor:
             logger.error(f"Error rendering video: {str(e)}")
             raise
 
+        finally:
+            # Downloaded footage stays cached in the temp directory; only the
+            # scratch files are specific to this render
+            await asyncio.to_thread(shutil.rmtree, work_dir, ignore_errors=True)
+
+    def _make_work_dir(self, prefix: str) -> Path:
+        """Create a scratch directory, falling back to the temp dir if tmpfs is full."""
+        try:
+            return Path(tempfile.mkdtemp(prefix=prefix, dir=self.scratch_dir))
+        except OSError as e:
+            logger.warning(f"Falling back to {self.temp_dir} for scratch files: {str(e)}")
+            return Path(tempfile.mkdtemp(prefix=prefix, dir=self.temp_dir))
+
     async def _download_footage(self, sentences: list[dict[str, Any]]) -> None:
-        """Download all footage files for the sentences."""
-        download_tasks = []
+        """Download and probe all footage files for the sentences.
+
+        Each file is probed as soon as it is available, so probing overlaps
+        with the downloads that are still running.
+        """
+        fetch_tasks = []
+        semaphore = asyncio.Semaphore(settings.footage_download_concurrency)
+
+        async def fetch_one(sentence: dict[str, Any], url: str, destination: Path) -> bool:
+            # Reuse footage already downloaded by an earlier render. Refreshing
+            # its mtime both checks that it exists and keeps the temp file
+            # sweeper from deleting it while this render still needs it.
+            try:
+                await asyncio.to_thread(os.utime, destination)
+                reused = True
+            except FileNotFoundError:
+                reused = False
+            if not reused:
+                async with semaphore:
+                    if not await download_video_file(url, destination):
+                        return False
+            sentence["_footage_probe"] = await probe_video(str(destination))
+            return True
 
         for i, sentence in enumerate(sentences):
             selected_footage = sentence.get("selected_footage")
@@ -208,8 +351,9 @@ class VideoEditor:
             footage_url = selected_footage["url"]
             # Create a unique filename for this footage
             file_extension = ".mp4"  # Default to mp4
-            if "." in footage_url.split("/")[-1]:
-                file_extension = "." + footage_url.split(".")[-1].split("?")[0]
+            url_filename = footage_url.rpartition("/")[2].partition("?")[0]
+            if "." in url_filename:
+                file_extension = "." + url_filename.rpartition(".")[2]
 
             filename = f"footage_{i}_{sentence.get('id', i)}{file_extension}"
             local_path = self.temp_dir / filename
@@ -217,92 +361,250 @@ class VideoEditor:
             # Store local path for later use
             sentence["_local_footage_path"] = str(local_path)
 
-            # Add download task if file doesn't exist
-            if not local_path.exists():
-                download_tasks.append(download_video_file(footage_url, local_path))
+            fetch_tasks.append(fetch_one(sentence, footage_url, local_path))
 
-        # Download all footage concurrently
-        if download_tasks:
-            results = await asyncio.gather(*download_tasks, return_exceptions=True)
+        # Download all footage concurrently over the shared connection pool
+        if fetch_tasks:
+            results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
             failed_downloads = sum(
                 1 for result in results if not result or isinstance(result, Exception)
             )
             if failed_downloads > 0:
                 logger.warning(f"{failed_downloads} footage downloads failed")
 
-    def _create_video_clips(
-        self, sentences: list[dict[str, Any]]
-    ) -> list[Any]:  # Returns list of VideoFileClip but using Any to avoid type issues
-        """Create video clips with subtitles for each sentence."""
-        clips = []
+    async def _prepare_segments(
+        self,
+        sentences: list[dict[str, Any]],
+        work_dir: Path,
+        add_subtitles: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Build the footage path, duration and subtitle file for each sentence.
+
+        With add_subtitles off no subtitle files are written, which leaves
+        the footage eligible for stream copy.
+        """
+        segments = []
 
-        for sentence in sentences:
+        for i, sentence in enumerate(sentences):
             local_footage_path = sentence.get("_local_footage_path")
-            if not local_footage_path or not os.path.exists(local_footage_path):
+            if not local_footage_path or not await aiofiles.os.path.exists(
+                local_footage_path
+            ):
                 logger.warning(
                     f"Local footage not found for sentence: {sentence.get('text', 'Unknown')}"
                 )
                 continue
 
-            try:
-                # Calculate clip duration from sentence timing
-                start_time = sentence.get("start_time", 0)
-                end_time = sentence.get("end_time", start_time + 5)
-                duration = end_time - start_time
-
-                # Load video clip
-                video_clip = VideoFileClip(local_footage_path)
-
-                # Trim to sentence duration (or use full clip if shorter)
-                if video_clip.duration > duration:  # type: ignore
-                    video_clip = video_clip.subclipped(0, duration)  # type: ignore
-                else:
-                    # If footage is shorter, loop it or extend
-                    if duration > video_clip.duration * 2:  # type: ignore
-                        # Loop video by repeating it
-                        times_to_loop = int(duration / video_clip.duration) + 1  # type: ignore
-                        video_clip = concatenate_videoclips([video_clip] * times_to_loop).subclipped(0, duration)  # type: ignore
-                    else:
-                        video_clip = video_clip.with_duration(duration)  # type: ignore
-
-                # Resize to standard HD resolution
-                if video_clip.w != 1920 or video_clip.h != 1080:  # type: ignore
-                    video_clip = video_clip.resized(newsize=(1920, 1080))  # type: ignore
-
-                # Add subtitle if text exists
-                text = sentence.get("text", "").strip()
-                if text:
-                    try:
-                        # Create subtitle
-                        subtitle = TextClip(
-                            text=text,
-                            font_size=50,
-                            color="white",
-                            font="Arial",
-                            stroke_color="black",
-                            stroke_width=2,
-                            size=(1800, None),  # Max width with margins
-                            method="caption",
-                        ).with_duration(duration)  # type: ignore
-
-                        # Position subtitle at bottom of screen
-                        subtitle = subtitle.with_position(("center", "bottom"))  # type: ignore
-
-                        # Composite video with subtitle
-                        video_clip = CompositeVideoClip([video_clip, subtitle])
-
-                    except Exception as e:
-                        logger.warning(f"Could not add subtitle '{text}': {str(e)}")
-
-                clips.append(video_clip)
-
-            except Exception as e:
-                logger.error(
-                    f"Error creating clip for sentence '{sentence.get('text', 'Unknown')}': {str(e)}"
+            # Calculate clip duration from sentence timing
+            start_time = sentence.get("start_time", 0)
+            end_time = sentence.get("end_time", start_time + 5)
+            duration = end_time - start_time
+            if duration <= 0:
+                logger.warning(
+                    f"Skipping sentence with no duration: {sentence.get('text', 'Unknown')}"
                 )
                 continue
 
-        return clips
+            # Subtitle text goes through a file so it needs no filter escaping
+            subtitle_path = None
+            text = sentence.get("text", "").strip() if add_subtitles else ""
+            if text:
+                subtitle_path = work_dir / f"subtitle_{i}.txt"
+                async with aiofiles.open(subtitle_path, "w", encoding="utf-8") as f:
+                    await f.write(textwrap.fill(text, SUBTITLE_WRAP_WIDTH))
+
+            segments.append(
+                {
+                    "path": local_footage_path,
+                    "duration": duration,
+                    "subtitle_path": str(subtitle_path) if subtitle_path else None,
+                    "probe": sentence.get("_footage_probe"),
+                }
+            )
+
+        return segments
+
+    @staticmethod
+    def _can_stream_copy(
+        segments: list[dict[str, Any]], music_file_path: str | None
+    ) -> bool:
+        """Check whether the footage can be concatenated without re-encoding.
+
+        That needs no overlays or music mixing, footage long enough that it
+        never has to loop, and identical stream parameters in every file.
+        """
+        if music_file_path:
+            return False
+
+        stream_keys = ("codec_name", "width", "height", "pix_fmt", "avg_frame_rate")
+        formats = set()
+        for segment in segments:
+            probe = segment.get("probe")
+            if (
+                segment["subtitle_path"]
+                or not probe
+                or probe["duration"] < segment["duration"]
+            ):
+                return False
+            formats.add(tuple(probe.get(key) for key in stream_keys))
+
+        return len(formats) == 1
+
+    @staticmethod
+    def _concat_list(segments: list[dict[str, Any]]) -> str:
+        """Build a concat demuxer list that cuts each file to its segment duration."""
+        lines = []
+        for segment in segments:
+            path = str(Path(segment["path"]).resolve()).replace("'", "'\\''")
+            lines.append(f"file '{path}'")
+            lines.append(f"outpoint {segment['duration']:.3f}")
+        return "\n".join(lines) + "\n"
+
+    def _build_copy_args(
+        self,
+        concat_list_path: Path,
+        segments: list[dict[str, Any]],
+        audio_file_path: str | None,
+        output_path: Path,
+    ) -> list[str]:
+        """Build the FFmpeg command line that joins footage without re-encoding.
+
+        Audio and music paths are expected to exist; missing ones are None.
+        """
+        args = [
+            "ffmpeg", "-y", "-hide_banner", "-nostats", "-progress", "pipe:1",
+            "-f", "concat", "-safe", "0", "-i", str(concat_list_path),
+        ]
+        if audio_file_path:
+            args += ["-i", audio_file_path, "-map", "0:v", "-map", "1:a", "-c:a", "aac"]
+
+        total_duration = sum(segment["duration"] for segment in segments)
+        args += [
+            "-t", f"{total_duration:.3f}",
+            "-c:v", "copy",
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+        return args
+
+    def _build_ffmpeg_args(
+        self,
+        segments: list[dict[str, Any]],
+        audio_file_path: str | None,
+        music_file_path: str | None,
+        output_path: Path,
+        encoder: str = "libx264",
+    ) -> list[str]:
+        """Build the FFmpeg command line that renders the whole video."""
+        args = ["ffmpeg", "-y", "-hide_banner", "-nostats", "-progress", "pipe:1"]
+        filters = []
+
+        # On NVENC hosts footage is decoded and scaled on the GPU, and only
+        # the output-sized frames are downloaded for subtitles
+        if encoder == "h264_nvenc":
+            decode_args = ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"]
+            scale_filter = (
+                f"scale_cuda={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:format=yuv420p,"
+                f"hwdownload,format=yuv420p"
+            )
+        else:
+            decode_args = []
+            scale_filter = (
+                f"scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:flags=fast_bilinear,"
+                f"format=yuv420p"
+            )
+
+        # One input per segment, cut to the sentence duration and looped only
+        # if the footage is shorter than the sentence (or could not be probed)
+        for i, segment in enumerate(segments):
+            probe = segment.get("probe")
+            if not probe or probe["duration"] < segment["duration"]:
+                args += ["-stream_loop", "-1"]
+            args += [
+                *decode_args,
+                "-t", f"{segment['duration']:.3f}",
+                "-i", segment["path"],
+            ]
+            # Drop to the output frame rate first so fewer frames get scaled
+            chain = f"[{i}:v]fps={OUTPUT_FPS},{scale_filter},setsar=1"
+            if segment["subtitle_path"]:
+                chain += "," + self._subtitle_filter(segment["subtitle_path"])
+            filters.append(f"{chain}[v{i}]")
+
+        video_labels = "".join(f"[v{i}]" for i in range(len(segments)))
+        filters.append(f"{video_labels}concat=n={len(segments)}:v=1:a=0[v]")
+
+        # Voice-over and background music follow the segment inputs
+        audio_label = None
+        next_input = len(segments)
+        if audio_file_path:
+            args += ["-i", audio_file_path]
+            audio_label = f"{next_input}:a"
+            next_input += 1
+
+        if music_file_path:
+            # Loop music to cover the whole video; the output is cut to length
+            args += ["-stream_loop", "-1", "-i", music_file_path]
+            filters.append(f"[{next_input}:a]volume={MUSIC_VOLUME}[music]")
+            if audio_label:
+                filters.append(
+                    f"[{audio_label}][music]amix=inputs=2:duration=longest:normalize=0[a]"
+                )
+                audio_label = "[a]"
+            else:
+                audio_label = "[music]"
+
+        total_duration = sum(segment["duration"] for segment in segments)
+        args += ["-filter_complex", ";".join(filters), "-map", "[v]"]
+        if audio_label:
+            args += ["-map", audio_label, "-c:a", "aac"]
+        args += [
+            "-t", f"{total_duration:.3f}",
+            "-r", str(OUTPUT_FPS),
+            *ENCODER_ARGS[encoder],
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+        return args
+
+    @staticmethod
+    def _subtitle_filter(subtitle_path: str) -> str:
+        """Build a drawtext filter that renders subtitles at the bottom of the frame."""
+        # Quoting keeps ':' and ',' in the path from being parsed by FFmpeg
+        return (
+            f"drawtext=textfile='{subtitle_path}':expansion=none:font=Arial:"
+            f"fontsize={SUBTITLE_FONT_SIZE}:fontcolor=white:"
+            f"borderw=2:bordercolor=black:line_spacing=8:"
+            f"x=(w-text_w)/2:y=h-text_h-40"
+        )
+
+    async def _run_ffmpeg(
+        self,
+        args: list[str],
+        total_duration: float,
+        progress_callback: ProgressCallback | None = None,
+    ) -> None:
+        """Run FFmpeg, reporting progress from its -progress output."""
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        # Drain stderr concurrently so FFmpeg never blocks on a full pipe
+        stderr_task = asyncio.create_task(process.stderr.read())  # type: ignore
+        total_frames = max(1, round(total_duration * OUTPUT_FPS))
+
+        async for line in process.stdout:  # type: ignore
+            key, _, value = line.decode().strip().partition("=")
+            if key == "frame" and value.isdigit() and progress_callback:
+                await progress_callback(min(int(value) / total_frames, 1.0))
+
+        stderr = await stderr_task
+        returncode = await process.wait()
+        if returncode != 0:
+            error_output = stderr.decode(errors="replace")[-2000:]
+            raise RuntimeError(f"FFmpeg exited with code {returncode}: {error_output}")
 
 
 async def render_project_video(
@@ -310,6 +612,8 @@ async def render_project_video(
     audio_file_path: str,
     music_file_path: str | None = None,
     output_filename: str | None = None,
+    progress_callback: ProgressCallback | None = None,
+    add_subtitles: bool = True,
 ) -> str:
     """Convenience function to render a project video."""
     editor = VideoEditor()
@@ -318,4 +622,6 @@ async def render_project_video(
         audio_file_path=audio_file_path,
         music_file_path=music_file_path,
         output_filename=output_filename,
+        progress_callback=progress_callback,
+        add_subtitles=add_subtitles,
     )
@@ -0,0 +1,44 @@
+import pytest
+
+
+class FakeSession:
+    """Minimal stand-in for an AsyncSession."""
+
+    def __init__(self):
+        self.info = {}
+
+
+class TestValidateEntityExists:
+    """Test cases for session-scoped existence checks."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_checks_query_once(self):
+        """Test that an ID validated on a session is not queried again until deleted."""
+        from src.base.controller import BaseController
+        from src.projects.repository import ProjectRepository
+
+        repository = ProjectRepository()
+        queries = []
+
+        async def fake_exists(session, entity_id):
+            queries.append(entity_id)
+            return True
+
+        async def fake_delete(session, entity_id):
+            return True
+
+        repository.exists = fake_exists
+        repository.delete = fake_delete
+        controller = BaseController(repository)
+        session = FakeSession()
+
+        await controller.validate_entity_exists(session, "project-1")
+        await controller.validate_entity_exists(session, "project-1")
+        assert queries == ["project-1"]
+
+        await controller.delete_entity(session, "project-1")
+        await controller.validate_entity_exists(session, "project-1")
+        assert queries == ["project-1", "project-1"]
+
+        await controller.validate_entity_exists(FakeSession(), "project-1")
+        assert len(queries) == 3
@@ -97,6 +97,23 @@ class TestProjectController:
         assert project.title == "Test Project"
         assert project.audio_file_path == "/tmp/test.mp3"
 
+    @pytest.mark.asyncio
+    async def test_duplicate_titles_are_numbered(self, test_session: AsyncSession):
+        """Test that a taken title gets the next free counter and is stored stripped."""
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate
+
+        controller = ProjectController()
+
+        titles = []
+        for title in ("Sunset Drive", " Sunset Drive ", "Sunset Drive"):
+            project = await controller.create_project_with_audio(
+                test_session, ProjectCreate(title=title, audio_file_path="/tmp/test.mp3")
+            )
+            titles.append(project.title)
+
+        assert titles == ["Sunset Drive", "Sunset Drive (2)", "Sunset Drive (3)"]
+
     @pytest.mark.asyncio
     async def test_get_project_with_details(self, test_session: AsyncSession):
         """Test getting project with all related data."""
@@ -122,3 +139,248 @@ class TestProjectController:
         assert details["sentences"] == []
         assert details["footage_choices"] == []
         assert details["music_recommendations"] == []
+
+    @pytest.mark.asyncio
+    async def test_update_project_with_details(self, test_session: AsyncSession):
+        """Test updating a project returns the updated project details."""
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate
+
+        controller = ProjectController()
+
+        project = await controller.create_project_with_audio(
+            test_session,
+            ProjectCreate(title="Update Me", audio_file_path="/tmp/test.mp3"),
+        )
+
+        details = await controller.update_project_with_details(
+            test_session, project.id, {"description": "Updated description"}
+        )
+
+        assert details["id"] == project.id
+        assert details["description"] == "Updated description"
+        assert details["sentences"] == []
+
+    @pytest.mark.asyncio
+    async def test_update_ignores_protected_fields(self, test_session: AsyncSession):
+        """Test that updates cannot change a project's ID or timestamps."""
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate
+
+        controller = ProjectController()
+
+        project = await controller.create_project_with_audio(
+            test_session,
+            ProjectCreate(title="Protected", audio_file_path="/tmp/test.mp3"),
+        )
+
+        details = await controller.update_project_with_details(
+            test_session,
+            project.id,
+            {"id": "proj-other", "created_at": None, "overall_mood": "Calm"},
+        )
+
+        assert details["id"] == project.id
+        assert details["created_at"] is not None
+        assert details["overall_mood"] == "Calm"
+
+    @pytest.mark.asyncio
+    async def test_add_sentences_to_project(self, test_session: AsyncSession):
+        """Test adding several sentences to a project in one batch."""
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate, SentenceCreate
+
+        controller = ProjectController()
+
+        project = await controller.create_project_with_audio(
+            test_session,
+            ProjectCreate(title="Batch Sentences", audio_file_path="/tmp/test.mp3"),
+        )
+
+        sentences = await controller.add_sentences_to_project(
+            test_session,
+            project.id,
+            [
+                SentenceCreate(text="First", start_time=0.0, end_time=1.0),
+                SentenceCreate(text="Second", start_time=1.0, end_time=2.5),
+            ],
+        )
+
+        assert [s["text"] for s in sentences] == ["First", "Second"]
+        assert all(s["project_id"] == project.id for s in sentences)
+
+        details = await controller.get_project_with_details(test_session, project.id)
+        assert sorted(s["text"] for s in details["sentences"]) == ["First", "Second"]
+        assert details["total_duration"] == 2.5
+
+    @pytest.mark.asyncio
+    async def test_get_projects_with_details(self, test_session: AsyncSession):
+        """Test that listed projects each get their own related data."""
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate, SentenceCreate
+
+        controller = ProjectController()
+
+        first = await controller.create_project_with_audio(
+            test_session,
+            ProjectCreate(title="Listing One", audio_file_path="/tmp/one.mp3"),
+        )
+        second = await controller.create_project_with_audio(
+            test_session,
+            ProjectCreate(title="Listing Two", audio_file_path="/tmp/two.mp3"),
+        )
+        await controller.add_sentences_to_project(
+            test_session,
+            first.id,
+            [SentenceCreate(text="Only", start_time=0.0, end_time=1.0)],
+        )
+
+        projects = await controller.get_projects_with_details(test_session)
+        by_id = {p["id"]: p for p in projects}
+        assert [s["text"] for s in by_id[first.id]["sentences"]] == ["Only"]
+        assert by_id[first.id]["total_sentences"] == 1
+        assert by_id[second.id]["sentences"] == []
+        assert by_id[second.id]["total_sentences"] == 0
+
+    @pytest.mark.asyncio
+    async def test_validate_ready_for_render(self, test_session: AsyncSession):
+        """Test that a project is only ready to render once every sentence has footage."""
+        from fastapi import HTTPException
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate, SelectedFootage, SentenceCreate
+
+        controller = ProjectController()
+
+        project = await controller.create_project_with_audio(
+            test_session,
+            ProjectCreate(title="Ready Check", audio_file_path="/tmp/test.mp3"),
+        )
+        sentences = await controller.add_sentences_to_project(
+            test_session,
+            project.id,
+            [
+                SentenceCreate(
+                    text="With footage",
+                    start_time=0.0,
+                    end_time=1.0,
+                    selected_footage=SelectedFootage.recommended(
+                        0, "With footage", 1.0, "https://cdn.example.com/a.mp4"
+                    ),
+                ),
+                SentenceCreate(text="Without footage", start_time=1.0, end_time=2.0),
+            ],
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await controller.validate_ready_for_render(test_session, project.id)
+        assert exc_info.value.status_code == 400
+
+        await controller.update_sentences_footage(
+            test_session,
+            project.id,
+            {
+                sentences[1]["id"]: SelectedFootage.user_selected(
+                    sentences[1]["id"], "https://cdn.example.com/b.mp4"
+                )
+            },
+        )
+        await controller.validate_ready_for_render(test_session, project.id)
+
+    @pytest.mark.asyncio
+    async def test_project_keyset_pagination(self, test_session: AsyncSession):
+        """Test that seeking past the last project returns the next page without overlap."""
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate
+
+        controller = ProjectController()
+
+        for title in ("Page A", "Page B", "Page C"):
+            await controller.create_project_with_audio(
+                test_session, ProjectCreate(title=title, audio_file_path="/tmp/test.mp3")
+            )
+
+        first_page = await controller.repository.get_page(test_session, limit=2)
+        last = first_page[-1]
+        second_page = await controller.repository.get_page(
+            test_session, limit=2, after=(last.created_at, last.id)
+        )
+
+        first_ids = [p.id for p in first_page]
+        second_ids = [p.id for p in second_page]
+        assert len(first_ids) == 2
+        assert not set(first_ids) & set(second_ids)
+        offset_page = await controller.repository.get_page(test_session, limit=2, skip=2)
+        assert [p.id for p in offset_page] == second_ids
+
+    @pytest.mark.asyncio
+    async def test_update_sentences_footage(self, test_session: AsyncSession):
+        """Test updating selected footage for several sentences in one batch."""
+        from fastapi import HTTPException
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate, SelectedFootage, SentenceCreate
+
+        controller = ProjectController()
+
+        project = await controller.create_project_with_audio(
+            test_session,
+            ProjectCreate(title="Batch Footage", audio_file_path="/tmp/test.mp3"),
+        )
+        sentences = await controller.add_sentences_to_project(
+            test_session,
+            project.id,
+            [
+                SentenceCreate(text="First", start_time=0.0, end_time=1.0),
+                SentenceCreate(text="Second", start_time=1.0, end_time=2.0),
+            ],
+        )
+
+        def footage(sentence_id: str) -> SelectedFootage:
+            return SelectedFootage(
+                id=f"footage-{sentence_id}",
+                title="Footage",
+                description="Footage",
+                thumbnail="/placeholder.svg",
+                duration=10.0,
+                tags=[],
+                category="user-selected",
+                mood="neutral",
+                relevance_score=100,
+                url=f"https://cdn.example.com/{sentence_id}.mp4",
+            )
+
+        updated = await controller.update_sentences_footage(
+            test_session, project.id, {s["id"]: footage(s["id"]) for s in sentences}
+        )
+        assert {s["selected_footage"]["url"] for s in updated} == {
+            f"https://cdn.example.com/{s['id']}.mp4" for s in sentences
+        }
+
+        with pytest.raises(HTTPException) as exc_info:
+            await controller.update_sentences_footage(
+                test_session, project.id, {"missing": footage("missing")}
+            )
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_delete_project(self, test_session: AsyncSession):
+        """Test that deleting a project removes it, its sentences, and reports missing projects."""
+        from src.projects.controller import ProjectController
+        from src.projects.schemas import ProjectCreate, SentenceCreate
+
+        controller = ProjectController()
+
+        project = await controller.create_project_with_audio(
+            test_session,
+            ProjectCreate(title="Delete Me", audio_file_path="/tmp/test.mp3"),
+        )
+        await controller.add_sentences_to_project(
+            test_session,
+            project.id,
+            [SentenceCreate(text="Gone", start_time=0.0, end_time=1.0)],
+        )
+
+        assert await controller.repository.exists(test_session, project.id)
+        assert await controller.repository.delete(test_session, project.id)
+        assert not await controller.repository.exists(test_session, project.id)
+        assert await controller.sentence_repo.get_by_project_id(test_session, project.id) == []
+        assert not await controller.repository.delete(test_session, project.id)
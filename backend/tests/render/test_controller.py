@@ -0,0 +1,36 @@
+import pytest
+
+
+class TestRenderStatusCache:
+    """Test cases for cached render status lookups."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(self, monkeypatch):
+        """Test that a cached status is served without a database read."""
+        from src.render import controller as render_controller
+
+        cached = {"status": "processing", "progress": 40, "video_url": None, "error": None}
+
+        async def fake_cache_get(key):
+            assert key == "render:status:task-1"
+            return cached
+
+        async def fail_get_entity(session, task_id):
+            raise AssertionError("The database should not be read on a cache hit")
+
+        controller = render_controller.RenderController()
+        monkeypatch.setattr(render_controller, "cache_get_json", fake_cache_get)
+        monkeypatch.setattr(controller, "get_entity", fail_get_entity)
+
+        assert await controller.get_render_status(None, "task-1") == cached
+
+    def test_etag_tracks_progress(self):
+        """Test that the ETag changes when any reported field changes."""
+        from src.render.controller import render_status_etag
+
+        status_info = {"status": "processing", "progress": 40, "video_url": None, "error": None}
+
+        assert render_status_etag(status_info) == render_status_etag(dict(status_info))
+        assert render_status_etag(status_info) != render_status_etag(
+            {**status_info, "progress": 60}
+        )
@@ -0,0 +1,39 @@
+import pytest
+
+
+class TestRenderProject:
+    """Test cases for starting a render."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_failure_marks_task_failed(self, monkeypatch):
+        """Test that a render the broker rejects is failed instead of left pending."""
+        from types import SimpleNamespace
+
+        from fastapi import HTTPException
+        from src.render import routes
+        from src.render.schemas import RenderRequest
+
+        updates = []
+
+        async def fake_validate(session, project_id):
+            pass
+
+        async def fake_create(session, project_id, render_request):
+            return SimpleNamespace(id="render-1")
+
+        async def fake_update(session, task_id, status, **kwargs):
+            updates.append((task_id, status))
+
+        def failing_delay(task_id, **options):
+            raise ConnectionError("broker unreachable")
+
+        monkeypatch.setattr(routes.project_controller, "validate_ready_for_render", fake_validate)
+        monkeypatch.setattr(routes.controller, "create_render_task", fake_create)
+        monkeypatch.setattr(routes.controller, "update_render_status", fake_update)
+        monkeypatch.setattr(routes.run_render, "delay", failing_delay)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await routes.render_project("proj-1", RenderRequest(), None, None)
+
+        assert exc_info.value.status_code == 503
+        assert updates == [("render-1", "failed")]
@@ -0,0 +1,92 @@
+import pytest
+
+
+class TestWriteProgress:
+    """Test cases for the background render progress writer."""
+
+    @pytest.mark.asyncio
+    async def test_writes_latest_progress_only(self):
+        """Test that superseded progress values are skipped and None stops the writer."""
+        import asyncio
+
+        from src.render.tasks import _put_latest, _write_progress
+
+        written = []
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+        async def fake_write(progress):
+            written.append(progress)
+
+        writer = asyncio.create_task(_write_progress(queue, fake_write, interval=0))
+        for progress in (41, 42, 43):
+            _put_latest(queue, progress)
+        await asyncio.sleep(0.01)
+        _put_latest(queue, 43)
+        _put_latest(queue, None)
+        await writer
+
+        assert written == [43]
+
+
+class TestProcessRender:
+    """Test cases for the local render pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_failed_progress_write_does_not_fail_render(self, monkeypatch, tmp_path):
+        """Test that a progress write error is skipped and the render still completes."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from src.render import tasks
+
+        audio_path = tmp_path / "voice.mp3"
+        audio_path.write_bytes(b"voice")
+        statuses = []
+
+        class FakeSession:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            async def rollback(self):
+                pass
+
+        async def fake_get_entity(session, task_id):
+            return SimpleNamespace(project_id="proj-1")
+
+        async def fake_project_details(session, project_id):
+            return {
+                "id": project_id,
+                "audio_file_path": str(audio_path),
+                "sentences": [],
+                "music_recommendations": [{"url": "music.mp3"}],
+            }
+
+        async def fake_update_status(session, task_id, status, progress=None, **kwargs):
+            if status == "processing" and progress > 40:
+                raise ConnectionError("database unavailable")
+            statuses.append(status)
+
+        async def fake_update_entity(session, project_id, data):
+            pass
+
+        async def fake_render(progress_callback, **kwargs):
+            await progress_callback(0.5)
+            await asyncio.sleep(0.01)
+            return str(tmp_path / "proj-1_final_video.mp4")
+
+        monkeypatch.setattr(tasks, "async_session_factory", FakeSession)
+        monkeypatch.setattr(tasks.controller, "get_entity", fake_get_entity)
+        monkeypatch.setattr(tasks.controller, "update_render_status", fake_update_status)
+        monkeypatch.setattr(tasks.project_controller, "get_project_with_details", fake_project_details)
+        monkeypatch.setattr(tasks.project_controller, "update_entity", fake_update_entity)
+        monkeypatch.setattr(tasks.settings, "use_lambda_rendering", False)
+        monkeypatch.setattr(tasks, "render_project_video", fake_render)
+        monkeypatch.setattr(tasks, "PROGRESS_WRITE_INTERVAL", 0)
+
+        await tasks.process_render("task-1")
+
+        assert statuses[-1] == "complete"
+        assert "failed" not in statuses
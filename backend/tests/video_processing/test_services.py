@@ -0,0 +1,333 @@
+import pytest
+
+
+class FakeResponse:
+    """Minimal stand-in for an httpx response."""
+
+    def __init__(self, payload: dict, status_code: int = 200):
+        self.payload = payload
+        self.status_code = status_code
+        self.text = str(payload)
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class FakeClient:
+    """Minimal stand-in for the shared httpx client."""
+
+    def __init__(self, response: FakeResponse):
+        self.response = response
+        self.calls = 0
+
+    async def post(self, *args, **kwargs) -> FakeResponse:
+        self.calls += 1
+        return self.response
+
+
+def completion(content: str) -> FakeResponse:
+    """Build a chat completion response with the given message content."""
+    return FakeResponse({"choices": [{"message": {"content": content}}]})
+
+
+class TestFindFootageForSentence:
+    """Test cases for footage lookup."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_pexels(self, monkeypatch):
+        """Test that a cached query is served without calling Pexels."""
+        from src.video_processing import services
+
+        async def fake_cache_get(key):
+            assert key == "pexels:sunset beach"
+            return {"url": "https://cdn.example.com/sunset.mp4"}
+
+        async def fail_search(search_query):
+            raise AssertionError("Pexels should not be called on a cache hit")
+
+        monkeypatch.setattr(services, "cache_get_json", fake_cache_get)
+        monkeypatch.setattr(services, "_search_pexels_video", fail_search)
+
+        url = await services.find_footage_for_sentence(
+            "Sunset at the beach", "sunset at the beach"
+        )
+        assert url == "https://cdn.example.com/sunset.mp4"
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_result(self, monkeypatch):
+        """Test that a fresh Pexels result is written to the cache."""
+        from src.video_processing import services
+
+        stored = {}
+
+        async def fake_cache_get(key):
+            return None
+
+        async def fake_cache_set(key, value, ttl=None):
+            stored[key] = value
+
+        async def fake_search(search_query):
+            return "https://cdn.example.com/city.mp4"
+
+        monkeypatch.setattr(services, "cache_get_json", fake_cache_get)
+        monkeypatch.setattr(services, "cache_set_json", fake_cache_set)
+        monkeypatch.setattr(services, "_search_pexels_video", fake_search)
+
+        url = await services.find_footage_for_sentence("City", "city lights")
+        assert url == "https://cdn.example.com/city.mp4"
+        assert stored["pexels:city lights"]["url"] == url
+
+    @pytest.mark.asyncio
+    async def test_query_ignores_punctuation_and_common_words(self, monkeypatch):
+        """Test that the search query is built from clean keywords."""
+        from src.video_processing import services
+
+        queries = []
+
+        async def fake_cache_get(key):
+            queries.append(key)
+            return {"url": "https://cdn.example.com/cat.mp4"}
+
+        monkeypatch.setattr(services, "cache_get_json", fake_cache_get)
+
+        await services.find_footage_for_sentence("x", "The cat, in the  garden. Sleeps")
+        assert queries == ["pexels:cat garden sleeps"]
+
+    @pytest.mark.asyncio
+    async def test_equivalent_queries_share_cache_key(self, monkeypatch):
+        """Test that queries differing only in whitespace hit the same cache entry."""
+        from src.video_processing import services
+
+        queries = []
+
+        async def fake_cache_get(key):
+            queries.append(key)
+            return {"url": "https://cdn.example.com/ab.mp4"}
+
+        monkeypatch.setattr(services, "cache_get_json", fake_cache_get)
+
+        await services.find_footage_for_sentence("x", "alpha beta")
+        await services.find_footage_for_sentence("x", "alpha  beta")
+        assert queries == ["pexels:alpha beta", "pexels:alpha beta"]
+
+
+class TestTranslateTexts:
+    """Test cases for batched translation."""
+
+    @pytest.mark.asyncio
+    async def test_single_request_for_batch(self, monkeypatch):
+        """Test that all texts are translated with one request."""
+        from src.video_processing import services
+
+        client = FakeClient(completion('{"translations": ["Hello", "World"]}'))
+        monkeypatch.setattr(services, "get_http_client", lambda: client)
+
+        translations = await services.translate_texts(["Hola", "Mundo"])
+        assert translations == ["Hello", "World"]
+        assert client.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_individual_translation(self, monkeypatch):
+        """Test that a malformed batch response falls back to per-text requests."""
+        from src.video_processing import services
+
+        client = FakeClient(completion('{"translations": ["Hello"]}'))
+        monkeypatch.setattr(services, "get_http_client", lambda: client)
+
+        async def fake_translate(text):
+            return f"en:{text}"
+
+        monkeypatch.setattr(services, "translate_text", fake_translate)
+
+        translations = await services.translate_texts(["Hola", "Mundo"])
+        assert translations == ["en:Hola", "en:Mundo"]
+
+
+class TestTranscribeAudio:
+    """Test cases for audio transcription."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_groq(self, monkeypatch, tmp_path):
+        """Test that previously transcribed audio is served from the cache."""
+        import hashlib
+
+        from src.video_processing import services
+
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake audio")
+        audio_hash = hashlib.sha256(b"fake audio").hexdigest()
+        sentences = [{"text": "Hi", "translated_text": "Hi", "start": 0.0, "end": 1.0}]
+
+        async def fake_cache_get(key):
+            assert key.endswith(audio_hash)
+            return {"sentences": sentences}
+
+        def fail_client():
+            raise AssertionError("Groq should not be called on a cache hit")
+
+        monkeypatch.setattr(services, "cache_get_json", fake_cache_get)
+        monkeypatch.setattr(services, "get_http_client", fail_client)
+
+        assert await services.transcribe_audio(str(audio_path)) == sentences
+
+    @pytest.mark.asyncio
+    async def test_english_audio_skips_translation(self, monkeypatch, tmp_path):
+        """Test that English transcripts are not sent for translation."""
+        from src.video_processing import services
+
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"english audio")
+
+        async def fake_cache_get(key):
+            return None
+
+        async def fake_cache_set(key, value, ttl=None):
+            pass
+
+        async def fail_translate(texts):
+            raise AssertionError("English text should not be translated")
+
+        client = FakeClient(
+            FakeResponse(
+                {
+                    "language": "English",
+                    "segments": [{"text": " Hello there", "start": 0.0, "end": 1.5}],
+                }
+            )
+        )
+        monkeypatch.setattr(services, "cache_get_json", fake_cache_get)
+        monkeypatch.setattr(services, "cache_set_json", fake_cache_set)
+        monkeypatch.setattr(services, "translate_texts", fail_translate)
+        monkeypatch.setattr(services, "get_http_client", lambda: client)
+
+        sentences = await services.transcribe_audio(str(audio_path))
+        assert sentences == [
+            {"text": "Hello there", "start": 0.0, "end": 1.5, "translated_text": "Hello there"}
+        ]
+
+
+class TestFindBackgroundMusic:
+    """Test cases for local background music lookup."""
+
+    @pytest.mark.asyncio
+    async def test_rescans_only_when_directory_changes(self, monkeypatch, tmp_path):
+        """Test that the directory listing is reused until the directory changes."""
+        import os
+
+        from src.video_processing import services
+
+        monkeypatch.setattr(services.settings.__class__, "audio_dir", property(lambda self: tmp_path))
+        monkeypatch.setattr(services, "_music_cache", None)
+        (tmp_path / "calm.mp3").write_bytes(b"")
+
+        scans = []
+        scan = services._scan_music_directory
+
+        def counting_scan():
+            scans.append(1)
+            return scan()
+
+        monkeypatch.setattr(services, "_scan_music_directory", counting_scan)
+
+        first = await services.find_background_music()
+        second = await services.find_background_music()
+        assert [t["name"] for t in first] == ["calm"]
+        assert second == first
+        assert len(scans) == 1
+
+        (tmp_path / "upbeat.mp3").write_bytes(b"")
+        os.utime(tmp_path, (0, 12345))
+
+        third = await services.find_background_music()
+        assert sorted(t["name"] for t in third) == ["calm", "upbeat"]
+        assert len(scans) == 2
+
+
+class TestFindFootageForSentences:
+    """Test cases for concurrent footage lookup."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_sentence_order(self, monkeypatch):
+        """Test that lookups run concurrently and results keep sentence order."""
+        import asyncio
+
+        from src.video_processing import services
+
+        async def fake_find(text, translated_text=None):
+            # Finish the first sentence last
+            await asyncio.sleep(0.01 if text == "first" else 0)
+            if text == "broken":
+                raise RuntimeError("boom")
+            return f"https://cdn.example.com/{text}.mp4"
+
+        monkeypatch.setattr(services, "find_footage_for_sentence", fake_find)
+
+        urls = await services.find_footage_for_sentences(
+            [{"text": "first"}, {"text": "broken"}, {"text": "third"}]
+        )
+        assert urls == [
+            "https://cdn.example.com/first.mp4",
+            "",
+            "https://cdn.example.com/third.mp4",
+        ]
+
+
+class TestSearchPexelsVideo:
+    """Test cases for picking a video file from Pexels results."""
+
+    @staticmethod
+    def pexels_client(video_files: list[dict]) -> FakeClient:
+        client = FakeClient(FakeResponse({"videos": [{"video_files": video_files}]}))
+        client.get = client.post
+        return client
+
+    @pytest.mark.asyncio
+    async def test_picks_largest_full_hd_file(self, monkeypatch):
+        """Test that the largest file no wider than 1920px is chosen."""
+        from src.video_processing import services
+
+        client = self.pexels_client(
+            [
+                {"width": 1280, "height": 720, "link": "hd"},
+                {"width": 3840, "height": 2160, "link": "4k"},
+                {"width": 1920, "height": 1080, "link": "full-hd"},
+            ]
+        )
+        monkeypatch.setattr(services, "get_http_client", lambda: client)
+
+        assert await services._search_pexels_video("ocean") == "full-hd"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_largest_file(self, monkeypatch):
+        """Test that the largest file is used when none fit Full HD."""
+        from src.video_processing import services
+
+        client = self.pexels_client(
+            [
+                {"width": 2560, "height": 1440, "link": "qhd"},
+                {"width": 3840, "height": 2160, "link": "4k"},
+            ]
+        )
+        monkeypatch.setattr(services, "get_http_client", lambda: client)
+
+        assert await services._search_pexels_video("ocean") == "4k"
+
+    @pytest.mark.asyncio
+    async def test_query_sent_as_params(self, monkeypatch):
+        """Test that the query is passed as encoded params, not interpolated."""
+        from src.video_processing import services
+
+        requests = []
+        client = self.pexels_client([{"width": 1280, "height": 720, "link": "hd"}])
+
+        async def fake_get(url, **kwargs):
+            requests.append((url, kwargs))
+            return client.response
+
+        client.get = fake_get
+        monkeypatch.setattr(services, "get_http_client", lambda: client)
+
+        await services._search_pexels_video("rock & roll")
+        url, kwargs = requests[0]
+        assert url.endswith("/search")
+        assert kwargs["params"]["query"] == "rock & roll"
@@ -0,0 +1,33 @@
+import os
+
+
+class TestCleanupTempFiles:
+    """Test cases for the temp directory sweeper."""
+
+    def test_removes_only_stale_temp_files(self, monkeypatch, tmp_path):
+        """Test that stale uploads and footage are removed and other files kept."""
+        from src.video_processing import tasks
+
+        monkeypatch.setattr(tasks.settings.__class__, "temp_dir", property(lambda self: tmp_path))
+        monkeypatch.setattr(
+            tasks.settings.__class__, "render_scratch_dir", property(lambda self: tmp_path)
+        )
+
+        stale_upload = tmp_path / "proj-1_voice.mp3.part"
+        stale_footage = tmp_path / "footage_0_sent-1.mp4"
+        fresh_upload = tmp_path / "proj-2_voice.mp3.part"
+        other_file = tmp_path / "notes.txt"
+        stale_render_dir = tmp_path / "render_proj-3_abc"
+        stale_render_dir.mkdir()
+        (stale_render_dir / "subtitle_0.txt").write_text("Hi")
+        for path in (stale_upload, stale_footage, fresh_upload, other_file):
+            path.write_bytes(b"data")
+        for path in (stale_upload, stale_footage, other_file, stale_render_dir):
+            os.utime(path, (0, 0))
+
+        assert tasks.cleanup_temp_files() == 3
+        assert not stale_upload.exists()
+        assert not stale_footage.exists()
+        assert not stale_render_dir.exists()
+        assert fresh_upload.exists()
+        assert other_file.exists()
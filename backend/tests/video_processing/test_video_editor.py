@@ -0,0 +1,284 @@
+from pathlib import Path
+
+import pytest
+
+
+class TestBuildFFmpegArgs:
+    """Test cases for the FFmpeg render command."""
+
+    @pytest.fixture
+    def editor(self, tmp_path):
+        from src.video_processing.video_editor import VideoEditor
+
+        return VideoEditor(temp_dir=tmp_path / "temp", output_dir=tmp_path / "output")
+
+    def test_segments_are_concatenated_in_one_graph(self, editor, tmp_path):
+        """Test that every segment is an input of a single concat filter graph."""
+        segments = [
+            {"path": "a.mp4", "duration": 2.0, "subtitle_path": None},
+            {"path": "b.mp4", "duration": 3.5, "subtitle_path": "b.txt"},
+        ]
+
+        args = editor._build_ffmpeg_args(
+            segments, None, None, Path("out.mp4")
+        )
+
+        graph = args[args.index("-filter_complex") + 1]
+        assert args.count("-i") == 2
+        assert "[v0][v1]concat=n=2:v=1:a=0[v]" in graph
+        assert "[0:v]fps=24,scale=1920:1080:flags=fast_bilinear" in graph
+        assert "drawtext=textfile='b.txt'" in graph
+        assert args[args.index("-t", args.index("-filter_complex")) + 1] == "5.500"
+        assert "-c:a" not in args
+        assert args[args.index("-c:v") + 1] == "libx264"
+
+    def test_music_is_mixed_under_voice(self, editor, tmp_path):
+        """Test that background music is attenuated and mixed with the voice-over."""
+        voice = tmp_path / "voice.mp3"
+        music = tmp_path / "music.mp3"
+        voice.write_bytes(b"")
+        music.write_bytes(b"")
+        segments = [{"path": "a.mp4", "duration": 2.0, "subtitle_path": None}]
+
+        args = editor._build_ffmpeg_args(segments, str(voice), str(music), Path("out.mp4"))
+
+        graph = args[args.index("-filter_complex") + 1]
+        assert "[2:a]volume=0.3[music]" in graph
+        assert "[1:a][music]amix=inputs=2" in graph
+        assert args[args.index("-map", args.index("-map") + 1) + 1] == "[a]"
+
+    def test_only_short_footage_is_looped(self, editor, tmp_path):
+        """Test that footage is looped only when it is shorter than its sentence."""
+        segments = [
+            {"path": "long.mp4", "duration": 2.0, "subtitle_path": None, "probe": {"duration": 8.0}},
+            {"path": "short.mp4", "duration": 5.0, "subtitle_path": None, "probe": {"duration": 3.0}},
+        ]
+
+        args = editor._build_ffmpeg_args(
+            segments, None, None, Path("out.mp4")
+        )
+
+        assert args.count("-stream_loop") == 1
+        assert args.index("-stream_loop") > args.index("long.mp4")
+        assert args.index("-stream_loop") < args.index("short.mp4")
+
+    def test_nvenc_decodes_and_scales_on_gpu(self, editor, tmp_path):
+        """Test that NVENC renders use CUDA decode and scaling."""
+        segments = [{"path": "a.mp4", "duration": 2.0, "subtitle_path": None}]
+
+        args = editor._build_ffmpeg_args(
+            segments, None, None, Path("out.mp4"), "h264_nvenc"
+        )
+
+        graph = args[args.index("-filter_complex") + 1]
+        assert "-hwaccel" in args[: args.index("-i")]
+        assert args[args.index("-hwaccel") + 1] == "cuda"
+        assert graph.startswith("[0:v]fps=24,scale_cuda=1920:1080")
+        assert args[args.index("-c:v") + 1] == "h264_nvenc"
+
+
+
+class TestStreamCopy:
+    """Test cases for joining footage without re-encoding."""
+
+    @staticmethod
+    def segment(duration: float, probe_duration: float = 10.0, **probe) -> dict:
+        return {
+            "path": "a.mp4",
+            "duration": duration,
+            "subtitle_path": None,
+            "probe": {
+                "codec_name": "h264",
+                "width": 1920,
+                "height": 1080,
+                "pix_fmt": "yuv420p",
+                "avg_frame_rate": "25/1",
+                "duration": probe_duration,
+                **probe,
+            },
+        }
+
+    def test_matching_footage_is_copied(self):
+        """Test that identical, long enough footage qualifies for stream copy."""
+        from src.video_processing.video_editor import VideoEditor
+
+        segments = [self.segment(2.0), self.segment(3.0)]
+        assert VideoEditor._can_stream_copy(segments, None)
+
+    @pytest.mark.parametrize(
+        "segment_kwargs",
+        [
+            {"width": 1280},
+            {"probe_duration": 1.0},
+        ],
+    )
+    def test_mismatched_or_short_footage_is_encoded(self, segment_kwargs):
+        """Test that differing formats or footage that must loop are re-encoded."""
+        from src.video_processing.video_editor import VideoEditor
+
+        segments = [self.segment(2.0), self.segment(2.0, **segment_kwargs)]
+        assert not VideoEditor._can_stream_copy(segments, None)
+
+    def test_subtitles_require_encoding(self):
+        """Test that footage with subtitles is never stream copied."""
+        from src.video_processing.video_editor import VideoEditor
+
+        segment = {**self.segment(2.0), "subtitle_path": "a.txt"}
+        assert not VideoEditor._can_stream_copy([segment], None)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("add_subtitles", [True, False])
+    async def test_stream_copy_depends_on_subtitles(self, tmp_path, add_subtitles):
+        """Test that prepared segments are only stream copied with subtitles off."""
+        from src.video_processing.video_editor import VideoEditor
+
+        editor = VideoEditor(temp_dir=tmp_path, output_dir=tmp_path / "out")
+        footage_path = tmp_path / "footage_0_sent-1.mp4"
+        footage_path.write_bytes(b"footage")
+        sentences = [
+            {
+                "text": "A sentence with text",
+                "start_time": 0.0,
+                "end_time": 2.0,
+                "_local_footage_path": str(footage_path),
+                "_footage_probe": self.segment(2.0)["probe"],
+            }
+        ]
+
+        segments = await editor._prepare_segments(sentences, tmp_path, add_subtitles)
+
+        assert (segments[0]["subtitle_path"] is not None) is add_subtitles
+        assert VideoEditor._can_stream_copy(segments, None) is not add_subtitles
+
+    def test_concat_list_cuts_each_file(self):
+        """Test that the concat list cuts every file at its segment duration."""
+        from src.video_processing.video_editor import VideoEditor
+
+        concat_list = VideoEditor._concat_list([self.segment(2.0)])
+        assert concat_list.splitlines()[1] == "outpoint 2.000"
+
+
+class TestGetVideoEncoder:
+    """Test cases for encoder selection."""
+
+    @pytest.mark.asyncio
+    async def test_setting_overrides_detection(self, monkeypatch):
+        """Test that an explicit VIDEO_ENCODER skips hardware detection."""
+        from src.video_processing import video_editor
+
+        async def fail_probe(*args):
+            raise AssertionError("FFmpeg should not be probed")
+
+        monkeypatch.setattr(video_editor, "_video_encoder", None)
+        monkeypatch.setattr(video_editor.settings, "video_encoder", "libx264")
+        monkeypatch.setattr(video_editor, "_ffmpeg_succeeds", fail_probe)
+
+        assert await video_editor.get_video_encoder() == "libx264"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_nvenc_test_encode_fails(self, monkeypatch):
+        """Test that a listed but unusable NVENC encoder is not selected."""
+        from src.video_processing import video_editor
+
+        async def fake_probe(*args):
+            if args == ("-encoders",):
+                return True, " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+            return False, ""
+
+        monkeypatch.setattr(video_editor, "_video_encoder", None)
+        monkeypatch.setattr(video_editor.settings, "video_encoder", "auto")
+        monkeypatch.setattr(video_editor, "_ffmpeg_succeeds", fake_probe)
+
+        assert await video_editor.get_video_encoder() == "libx264"
+
+
+class TestDownloadVideoFile:
+    """Test cases for streaming footage downloads."""
+
+    @pytest.mark.asyncio
+    async def test_streams_body_to_destination(self, monkeypatch, tmp_path):
+        """Test that the response body is written to the destination file."""
+        import httpx
+        from src.video_processing import video_editor
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"video"))
+        )
+        monkeypatch.setattr(video_editor, "get_http_client", lambda: client)
+        destination = tmp_path / "footage.mp4"
+
+        assert await video_editor.download_video_file("https://cdn.example.com/a.mp4", destination)
+        assert destination.read_bytes() == b"video"
+        assert list(tmp_path.iterdir()) == [destination]
+
+    @pytest.mark.asyncio
+    async def test_failed_download_leaves_no_file(self, monkeypatch, tmp_path):
+        """Test that a failed download leaves neither the file nor a partial file."""
+        import httpx
+        from src.video_processing import video_editor
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500))
+        )
+        monkeypatch.setattr(video_editor, "get_http_client", lambda: client)
+        monkeypatch.setattr(video_editor, "DOWNLOAD_BACKOFF_BASE", 0)
+
+        assert not await video_editor.download_video_file(
+            "https://cdn.example.com/a.mp4", tmp_path / "footage.mp4"
+        )
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self, monkeypatch, tmp_path):
+        """Test that server errors are retried before the download succeeds."""
+        import httpx
+        from src.video_processing import video_editor
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503 if len(requests) == 1 else 200, content=b"video")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(video_editor, "get_http_client", lambda: client)
+        monkeypatch.setattr(video_editor, "DOWNLOAD_BACKOFF_BASE", 0)
+        destination = tmp_path / "footage.mp4"
+
+        assert await video_editor.download_video_file("https://cdn.example.com/a.mp4", destination)
+        assert destination.read_bytes() == b"video"
+        assert len(requests) == 2
+
+
+class TestDownloadFootage:
+    """Test cases for fetching the footage of a project."""
+
+    @pytest.mark.asyncio
+    async def test_cached_footage_is_probed_without_download(self, monkeypatch, tmp_path):
+        """Test that footage from an earlier render is reused, probed and kept fresh."""
+        import os
+
+        from src.video_processing import video_editor
+
+        editor = video_editor.VideoEditor(temp_dir=tmp_path, output_dir=tmp_path / "out")
+        cached_path = tmp_path / "footage_0_sent-1.mp4"
+        cached_path.write_bytes(b"cached")
+        os.utime(cached_path, (0, 0))
+
+        async def fail_download(url, destination):
+            raise AssertionError("Cached footage should not be downloaded again")
+
+        async def fake_probe(path):
+            return {"duration": 4.0}
+
+        monkeypatch.setattr(video_editor, "download_video_file", fail_download)
+        monkeypatch.setattr(video_editor, "probe_video", fake_probe)
+
+        sentences = [
+            {"id": "sent-1", "selected_footage": {"url": "https://cdn.example.com/a.mp4"}}
+        ]
+        await editor._download_footage(sentences)
+
+        assert sentences[0]["_footage_probe"] == {"duration": 4.0}
+        # The temp file sweeper must not treat reused footage as stale
+        assert cached_path.stat().st_mtime > 0
@@ -2,7 +2,7 @@
 
 import { type Client, formDataBodySerializer, type Options as Options2, type TDataShape } from './client';
 import { client } from './client.gen';
-import type { CreateProjectApiV1ProjectsPostData, CreateProjectApiV1ProjectsPostErrors, CreateProjectApiV1ProjectsPostResponses, DeleteProjectApiV1ProjectsProjectIdDeleteData, DeleteProjectApiV1ProjectsProjectIdDeleteErrors, DeleteProjectApiV1ProjectsProjectIdDeleteResponses, GenerateTitleForProjectApiV1ProjectsProjectIdGenerateTitlePostData, GenerateTitleForProjectApiV1ProjectsProjectIdGenerateTitlePostErrors, GenerateTitleForProjectApiV1ProjectsProjectIdGenerateTitlePostResponses, GetAllProjectsApiV1ProjectsGetData, GetAllProjectsApiV1ProjectsGetErrors, GetAllProjectsApiV1ProjectsGetResponses, GetProjectDetailsApiV1ProjectsProjectIdGetData, GetProjectDetailsApiV1ProjectsProjectIdGetErrors, GetProjectDetailsApiV1ProjectsProjectIdGetResponses, GetProjectRenderStatusApiV1ProjectsRenderStatusTaskIdGetData, GetProjectRenderStatusApiV1ProjectsRenderStatusTaskIdGetErrors, GetProjectRenderStatusApiV1ProjectsRenderStatusTaskIdGetResponses, GetProjectRenderTasksApiV1RenderProjectIdTasksGetData, GetProjectRenderTasksApiV1RenderProjectIdTasksGetErrors, GetProjectRenderTasksApiV1RenderProjectIdTasksGetResponses, GetRenderStatusApiV1RenderStatusTaskIdGetData, GetRenderStatusApiV1RenderStatusTaskIdGetErrors, GetRenderStatusApiV1RenderStatusTaskIdGetResponses, HealthCheckHealthGetData, HealthCheckHealthGetResponses, OptionsHandlerFullPathOptionsData, OptionsHandlerFullPathOptionsErrors, OptionsHandlerFullPathOptionsResponses, PatchProjectApiV1ProjectsProjectIdPatchData, PatchProjectApiV1ProjectsProjectIdPatchErrors, PatchProjectApiV1ProjectsProjectIdPatchResponses, RenderProjectApiV1ProjectsProjectIdRenderPostData, RenderProjectApiV1ProjectsProjectIdRenderPostErrors, RenderProjectApiV1ProjectsProjectIdRenderPostResponses, RenderProjectApiV1RenderProjectIdRenderPostData, RenderProjectApiV1RenderProjectIdRenderPostErrors, RenderProjectApiV1RenderProjectIdRenderPostResponses, SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostData, SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostErrors, SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostResponses, UpdateProjectApiV1ProjectsProjectIdPutData, UpdateProjectApiV1ProjectsProjectIdPutErrors, UpdateProjectApiV1ProjectsProjectIdPutResponses, UpdateRenderStatusApiV1RenderStatusTaskIdPutData, UpdateRenderStatusApiV1RenderStatusTaskIdPutErrors, UpdateRenderStatusApiV1RenderStatusTaskIdPutResponses } from './types.gen';
+import type { CreateProjectApiV1ProjectsPostData, CreateProjectApiV1ProjectsPostErrors, CreateProjectApiV1ProjectsPostResponses, DeleteProjectApiV1ProjectsProjectIdDeleteData, DeleteProjectApiV1ProjectsProjectIdDeleteErrors, DeleteProjectApiV1ProjectsProjectIdDeleteResponses, GenerateTitleForProjectApiV1ProjectsProjectIdGenerateTitlePostData, GenerateTitleForProjectApiV1ProjectsProjectIdGenerateTitlePostErrors, GenerateTitleForProjectApiV1ProjectsProjectIdGenerateTitlePostResponses, GetAllProjectsApiV1ProjectsGetData, GetAllProjectsApiV1ProjectsGetErrors, GetAllProjectsApiV1ProjectsGetResponses, GetProjectDetailsApiV1ProjectsProjectIdGetData, GetProjectDetailsApiV1ProjectsProjectIdGetErrors, GetProjectDetailsApiV1ProjectsProjectIdGetResponses, GetProjectRenderStatusApiV1ProjectsRenderStatusTaskIdGetData, GetProjectRenderStatusApiV1ProjectsRenderStatusTaskIdGetErrors, GetProjectRenderStatusApiV1ProjectsRenderStatusTaskIdGetResponses, GetProjectRenderTasksApiV1RenderProjectIdTasksGetData, GetProjectRenderTasksApiV1RenderProjectIdTasksGetErrors, GetProjectRenderTasksApiV1RenderProjectIdTasksGetResponses, GetRenderStatusApiV1RenderStatusTaskIdGetData, GetRenderStatusApiV1RenderStatusTaskIdGetErrors, GetRenderStatusApiV1RenderStatusTaskIdGetResponses, HealthCheckHealthGetData, HealthCheckHealthGetResponses, OptionsHandlerFullPathOptionsData, OptionsHandlerFullPathOptionsErrors, OptionsHandlerFullPathOptionsResponses, PatchProjectApiV1ProjectsProjectIdPatchData, PatchProjectApiV1ProjectsProjectIdPatchErrors, PatchProjectApiV1ProjectsProjectIdPatchResponses, RenderProjectApiV1RenderProjectIdRenderPostData, RenderProjectApiV1RenderProjectIdRenderPostErrors, RenderProjectApiV1RenderProjectIdRenderPostResponses, SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostData, SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostErrors, SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostResponses, UpdateProjectApiV1ProjectsProjectIdPutData, UpdateProjectApiV1ProjectsProjectIdPutErrors, UpdateProjectApiV1ProjectsProjectIdPutResponses, UpdateRenderStatusApiV1RenderStatusTaskIdPutData, UpdateRenderStatusApiV1RenderStatusTaskIdPutErrors, UpdateRenderStatusApiV1RenderStatusTaskIdPutResponses } from './types.gen';
 
 export type Options<TData extends TDataShape = TDataShape, ThrowOnError extends boolean = boolean> = Options2<TData, ThrowOnError> & {
     /**
@@ -142,18 +142,6 @@ export const submitFootageChoicesApiV1ProjectsProjectIdFootagePost = <ThrowOnErr
     });
 };
 
-/**
- * Render Project
- * Start rendering a video for a project.
- */
-export const renderProjectApiV1ProjectsProjectIdRenderPost = <ThrowOnError extends boolean = false>(options: Options<RenderProjectApiV1ProjectsProjectIdRenderPostData, ThrowOnError>) => {
-    return (options.client ?? client).post<RenderProjectApiV1ProjectsProjectIdRenderPostResponses, RenderProjectApiV1ProjectsProjectIdRenderPostErrors, ThrowOnError>({
-        responseType: 'json',
-        url: '/api/v1/projects/{project_id}/render',
-        ...options
-    });
-};
-
 /**
  * Get Project Render Status
  * Get the status of a render task (project-scoped route).
@@ -431,34 +431,6 @@ export type SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostResponses = {
 
 export type SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostResponse = SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostResponses[keyof SubmitFootageChoicesApiV1ProjectsProjectIdFootagePostResponses];
 
-export type RenderProjectApiV1ProjectsProjectIdRenderPostData = {
-    body?: never;
-    path: {
-        /**
-         * Project Id
-         */
-        project_id: string;
-    };
-    query?: never;
-    url: '/api/v1/projects/{project_id}/render';
-};
-
-export type RenderProjectApiV1ProjectsProjectIdRenderPostErrors = {
-    /**
-     * Validation Error
-     */
-    422: HttpValidationError;
-};
-
-export type RenderProjectApiV1ProjectsProjectIdRenderPostError = RenderProjectApiV1ProjectsProjectIdRenderPostErrors[keyof RenderProjectApiV1ProjectsProjectIdRenderPostErrors];
-
-export type RenderProjectApiV1ProjectsProjectIdRenderPostResponses = {
-    /**
-     * Successful Response
-     */
-    202: unknown;
-};
-
 export type GetProjectRenderStatusApiV1ProjectsRenderStatusTaskIdGetData = {
     body?: never;
     path: {